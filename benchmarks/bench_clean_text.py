@@ -0,0 +1,68 @@
+"""Compare per-cell text cleaning with the vectorized ingest stage.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_clean_text.py
+"""
+import os
+import random
+import sys
+import timeit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from streamlit_app import TEXT_ARTIFACTS, clean_text_columns  # noqa: E402
+
+ROWS = 200
+COLUMNS = 30
+REPEAT = 20
+
+
+def legacy_clean_text(text):
+    """The per-cell cleaner that ran through df[col].apply() before vectorization"""
+    if not isinstance(text, str):
+        return str(text) if text is not None else ""
+    cleaned = text
+    for artifact, replacement in TEXT_ARTIFACTS:
+        cleaned = cleaned.replace(artifact, replacement)
+    return cleaned.strip()
+
+
+def legacy_clean(df):
+    for col in df.columns:
+        if df[col].dtype == 'object' or pd.api.types.is_string_dtype(df[col]):
+            df[col] = df[col].apply(legacy_clean_text)
+    return df
+
+
+def make_sheet(rows=ROWS, columns=COLUMNS, artifact_rate=0.05, seed=0):
+    """Build a sheet of text cells, a few of which carry encoding artifacts"""
+    rnd = random.Random(seed)
+    words = ["Janja Garnbret ", " Qualified", "Podium Contention", "Top in 2", "Zone", "FRA", "-"]
+    data = {}
+    for c in range(columns):
+        cells = []
+        for _ in range(rows):
+            cell = rnd.choice(words)
+            if rnd.random() < artifact_rate:
+                cell += rnd.choice(TEXT_ARTIFACTS)[0]
+            cells.append(cell)
+        data[f"Column {c}"] = cells
+    return pd.DataFrame(data)
+
+
+def main():
+    sheet = make_sheet()
+    legacy = min(timeit.repeat(lambda: legacy_clean(sheet.copy()), number=1, repeat=REPEAT))
+    vectorized = min(timeit.repeat(lambda: clean_text_columns(sheet.copy()), number=1, repeat=REPEAT))
+
+    print(f"Text cleaning, {ROWS} rows x {COLUMNS} columns (best of {REPEAT})")
+    print(f"  per-cell apply : {legacy * 1000:8.2f} ms")
+    print(f"  vectorized     : {vectorized * 1000:8.2f} ms")
+    print(f"  speedup        : {legacy / vectorized:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Compare the pandas CSV ingest path with the column-pruned Arrow parser.
+
+Each parser runs in a fresh process so peak memory is measured per path: Python
+and NumPy allocations via tracemalloc, Arrow buffers via its memory pool.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_parse.py
+"""
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from multiprocessing import get_context
+
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from streamlit_app import parse_sheet_csv, prepare_sheet_frame  # noqa: E402
+
+ROWS = 500
+HELPER_COLUMNS = 20
+REPEAT = 20
+
+
+def legacy_parse(content):
+    """The ingest path before column pruning: decode, read everything, drop helpers afterwards"""
+    return prepare_sheet_frame(pd.read_csv(StringIO(content.decode('utf-8'))))
+
+
+def make_lead_csv(rows=ROWS, helper_columns=HELPER_COLUMNS, seed=0):
+    """Build a lead sheet export with the blank and scratch columns real sheets carry"""
+    rnd = random.Random(seed)
+    data = {
+        'Name': [f"Athlete {i}" for i in range(rows)],
+        'Manual Score': [rnd.choice(["", "12", "35+", "40", "28.5"]) for _ in range(rows)],
+        'Current Rank': [str(i + 1) for i in range(rows)],
+        'Status': [rnd.choice(["Qualified ✓✓", "Eliminated ✗", "Podium Contention ⚠"]) for _ in range(rows)],
+        'Worst Finish': [rnd.choice(["", "3", "8", "12"]) for _ in range(rows)],
+        'Hold for 1st': [rnd.choice(["", "38+"]) for _ in range(rows)],
+    }
+    for c in range(helper_columns):
+        data[f"Scratch {c}" if c % 2 else f"Unnamed: {c}"] = [rnd.random() for _ in range(rows)]
+    return pd.DataFrame(data).to_csv(index=False).encode('utf-8')
+
+
+def measure(path):
+    """Best-of time and peak memory of one parser, run in the calling (fresh) process"""
+    content = make_lead_csv()
+    parse = legacy_parse if path == 'pandas' else lambda body: parse_sheet_csv(body, "Lead")
+
+    pool = pa.default_memory_pool()
+    tracemalloc.start()
+    parse(content)
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    arrow_peak = pool.max_memory() or 0
+
+    best = min(timeit.repeat(lambda: parse(content), number=1, repeat=REPEAT))
+    return best, python_peak, arrow_peak
+
+
+def main():
+    results = {}
+    for path in ('pandas', 'arrow'):
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+            results[path] = pool.submit(measure, path).result()
+
+    print(f"Lead CSV parse, {ROWS} rows, {HELPER_COLUMNS} helper columns (best of {REPEAT})")
+    print(f"  {'':16} {'time':>10} {'python peak':>13} {'arrow peak':>12}")
+    for path, (best, python_peak, arrow_peak) in results.items():
+        print(f"  {path:16} {best * 1000:7.2f} ms {python_peak / 1024:9.0f} KiB {arrow_peak / 1024:8.0f} KiB")
+    print(f"  speedup        : {results['pandas'][0] / results['arrow'][0]:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
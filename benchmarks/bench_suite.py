@@ -0,0 +1,246 @@
+"""Offline benchmark suite: fetch, parse and render cost against a local stand-in for Google Sheets.
+
+A local HTTP server serves synthetic CSV exports shaped like the sheets in
+SHEETS_URLS (configurable athlete counts, partial boulder completion, strategy
+columns and lead threshold rows). For every competition type the suite times
+load_sheet_data (cold and revalidated), get_competition_status,
+build_competition_snapshot (including an uncached Monte Carlo simulation) and,
+under Streamlit's headless AppTest harness, display_enhanced_metrics and the
+boulder/lead display functions. Medians are compared with
+benchmarks/baseline.json; baselines are machine-specific, so record one on the
+machine you compare on.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_suite.py                   # compare with the baseline
+    $ python benchmarks/bench_suite.py --save-baseline   # record a new baseline
+    $ python benchmarks/bench_suite.py --athletes 40 --completion 0.5
+"""
+import argparse
+import itertools
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import threading
+import timeit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import streamlit_app as app  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+BOULDER_SCORES = [0, 9.9, 10.0, 24.9, 25.0]
+THRESHOLDS = {'Hold for 1st': '41+', 'Hold for 2nd': '38', 'Hold for 3rd': '35+', 'Hold to Qualify': '27+', 'Min to Qualify': '22'}
+
+
+def boulder_sheet(athletes, completion, final, seed=0):
+    """A boulder round where each athlete has climbed about `completion` of the four boulders"""
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(athletes):
+        done = min(4, max(0, round(completion * 4 + rnd.uniform(-1, 1))))
+        scores = [rnd.choice(BOULDER_SCORES) if b < done else None for b in range(4)]
+        rows.append({
+            'Athlete Name': f"Athlete {i}",
+            'Country': rnd.choice(["FRA", "JPN", "SLO", "USA"]),
+            **{f'Boulder {b + 1} Score (0-25)': score for b, score in enumerate(scores)},
+            'Total Score': round(sum(score or 0 for score in scores), 1),
+            'done': done,
+        })
+    df = pd.DataFrame(rows).sort_values('Total Score', ascending=False).reset_index(drop=True)
+    df.insert(1, 'Current Position/Rank', range(1, len(df) + 1))
+    cut = 3 if final else 8
+    df['Worst Possible Finish'] = [
+        str(rank + rnd.randint(0, cut)) if done == 4 else "" for rank, done in zip(df['Current Position/Rank'], df['done'])
+    ]
+    for place in ("1st", "2nd", "3rd"):
+        df[f'{place} Place Strategy'] = [rnd.choice(["Top in 2", "Zone", "Top"]) if done == 3 else "" for done in df['done']]
+    df[''] = ""
+    return df.drop(columns='done')
+
+
+def lead_sheet(athletes, completion, seed=0):
+    """A lead round with `completion` of the athletes scored and the threshold row at the bottom"""
+    rnd = random.Random(seed)
+    scored = round(athletes * completion)
+    df = pd.DataFrame({
+        'Name': [f"Climber {i}" for i in range(athletes)],
+        'Manual Score': [rnd.choice(["12", "35+", "40", "28.5", "41+"]) if i < scored else "" for i in range(athletes)],
+        'Current Rank': range(1, athletes + 1),
+        'Status': [rnd.choice(["Qualified ✓✓", "Eliminated ✗", "Podium Contention ⚠"]) if i < scored else "" for i in range(athletes)],
+        'Worst Finish': [str(i + rnd.randint(1, 4)) if i < scored else "" for i in range(athletes)],
+    })
+    for col in THRESHOLDS:
+        df[col] = ""
+    df.loc[len(df)] = {'Name': "Hold for 1st", **THRESHOLDS}
+    return df
+
+
+def make_sheets(athletes, completion):
+    """CSV bodies for every sheet in SHEETS_URLS, keyed by gid"""
+    sheets = {}
+    for seed, (name, url) in enumerate(app.SHEETS_URLS.items()):
+        gid = parse_qs(urlparse(url).query)['gid'][0]
+        if "Boulder" in name:
+            df = boulder_sheet(athletes, completion, "Final" in name, seed)
+        else:
+            df = lead_sheet(athletes, completion, seed)
+        sheets[gid] = df.to_csv(index=False).encode('utf-8')
+    return sheets
+
+
+def serve(sheets):
+    """Start a local sheet server on a free port; returns (server, base url)"""
+    class SheetHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            gid = parse_qs(urlparse(self.path).query).get('gid', [''])[0]
+            body = sheets.get(gid)
+            if body is None:
+                self.send_error(404)
+                return
+            etag = f'"{gid}-{len(body)}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/csv')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SheetHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/export?format=csv"
+
+
+def render_script(competition, repeat):
+    """AppTest page: render one competition `repeat` times and record how long each part took"""
+    import time
+
+    import streamlit as st
+
+    import streamlit_app as app
+
+    display = app.display_boulder_results if competition.schema.discipline == "Boulder" else app.display_lead_results
+    timings = {'metrics': [], 'results': []}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app.display_enhanced_metrics(competition)
+        timings['metrics'].append(time.perf_counter() - start)
+        start = time.perf_counter()
+        display(competition)
+        timings['results'].append(time.perf_counter() - start)
+    st.session_state.timings = timings
+
+
+def median_ms(func, repeat):
+    return statistics.median(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def run_suite(athletes, completion, repeat):
+    """Time every stage for one sheet of each competition type; returns {stage/type: median ms}"""
+    server, base_url = serve(make_sheets(athletes, completion))
+    session = app.get_http_session()
+    results = {}
+    try:
+        seen = set()
+        for name, url in app.SHEETS_URLS.items():
+            kind = app.competition_type(name)
+            if kind in seen:
+                continue
+            seen.add(kind)
+            gid = parse_qs(urlparse(url).query)['gid'][0]
+            local_url = f"{base_url}&gid={gid}"
+            discipline = app.competition_discipline(name)
+
+            def cold_load():
+                return app.load_sheet_data(local_url, {'lock': threading.Lock(), 'entries': {}}, session, discipline)
+
+            store = {'lock': threading.Lock(), 'entries': {}}
+            df, content_hash = app.load_sheet_data(local_url, store, session, discipline)
+            results[f"load_sheet_data/{kind}"] = median_ms(cold_load, repeat)
+            results[f"load_sheet_data (304)/{kind}"] = median_ms(
+                lambda: app.load_sheet_data(local_url, store, session, discipline), repeat
+            )
+            results[f"get_competition_status/{kind}"] = median_ms(lambda: app.get_competition_status(df, name), repeat)
+            # A fresh hash per run, so the simulation's per-hash cache never answers instead
+            runs = itertools.count()
+            results[f"build_competition_snapshot/{kind}"] = median_ms(
+                lambda: app.build_competition_snapshot(name, df, f"{content_hash}-{next(runs)}"), repeat
+            )
+
+            competition = app.build_competition_snapshot(name, df, content_hash)
+            at = AppTest.from_function(render_script, args=(competition, repeat), default_timeout=60)
+            at.run()
+            if at.exception:
+                raise RuntimeError(f"Rendering {name} failed: {at.exception[0].value}")
+            timings = at.session_state['timings']
+            results[f"display_enhanced_metrics/{kind}"] = statistics.median(timings['metrics']) * 1000
+            results[f"display results/{kind}"] = statistics.median(timings['results']) * 1000
+    finally:
+        server.shutdown()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--athletes', type=int, default=24, help="athletes per sheet")
+    parser.add_argument('--completion', type=float, default=0.75, help="fraction of the round already climbed")
+    parser.add_argument('--repeat', type=int, default=30, help="runs per measurement; the median is reported")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="slowdown ratio reported as a regression")
+    parser.add_argument('--save-baseline', action='store_true', help=f"write the results to {BASELINE_PATH}")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    params = {'athletes': args.athletes, 'completion': args.completion}
+    results = run_suite(args.athletes, args.completion, args.repeat)
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump({'params': params, 'results': results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            stored = json.load(f)
+        if stored['params'] == params:
+            baseline = stored['results']
+        else:
+            print(f"Baseline was recorded with {stored['params']}, not comparing")
+
+    print(f"{args.athletes} athletes, {args.completion:.0%} complete, median of {args.repeat} runs (ms)")
+    print(f"  {'stage':52} {'now':>8} {'baseline':>9} {'ratio':>6}")
+    regressions = []
+    for key, value in results.items():
+        before = baseline.get(key)
+        if before:
+            ratio = value / before
+            flag = "  << regression" if ratio > args.tolerance else ""
+            if flag:
+                regressions.append(key)
+            print(f"  {key:52} {value:8.2f} {before:9.2f} {ratio:6.2f}{flag}")
+        else:
+            print(f"  {key:52} {value:8.2f} {'-':>9} {'-':>6}")
+
+    if regressions:
+        print(f"{len(regressions)} stage(s) slower than {args.tolerance}x the baseline")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
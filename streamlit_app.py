@@ -1,11 +1,29 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
 import requests
-from io import StringIO
+from requests.adapters import HTTPAdapter
+from io import BytesIO, TextIOWrapper
+import csv
 import time
 from datetime import datetime, timedelta
 import logging
 import re
+import hashlib
+import sqlite3
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from collections import OrderedDict
+from functools import lru_cache
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import bisect
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -251,14 +269,169 @@ SHEETS_URLS = {
     "Female Lead Final": "https://docs.google.com/spreadsheets/d/1MwVp1mBUoFrzRSIIu4UdMcFlXpxHAi_R7ztp1E4Vgx0/export?format=csv&gid=528108640"
 }
 
+# Workbook tab title for each competition, used when the whole spreadsheet is fetched at once
+WORKBOOK_TABS = {name: name for name in SHEETS_URLS}
+
 # Configuration
 CONFIG = {
-    'CACHE_TTL': 30,
-    'AUTO_REFRESH_INTERVAL': 60,  # Increased to 60 seconds for better performance
-    'MAX_RETRIES': 3,
+    'REFRESH_INTERVALS': {  # Seconds between background refreshes of a sheet, by competition status
+        'live': 5,
+        'upcoming': 60,
+        # A round counts as completed once 80% of athletes have a score, so the last
+        # climbers still trickle in; None would freeze completed rounds entirely
+        'completed': 300,
+    },
+    'MAX_STALENESS': 300,  # Seconds stale data is served after failed refreshes before showing an error
+    'MAX_RETRIES': 3,  # Consecutive failures retried with backoff before a source's breaker opens
+    'RETRY_BASE_DELAY': 2,
+    'RETRY_MAX_DELAY': 30,
+    'BREAKER_COOLDOWN': 120,  # Seconds an open breaker leaves a failing source alone
+    'CONNECT_TIMEOUT': 5,
     'REQUEST_TIMEOUT': 15,
+    'HTTP_POOL_SIZE': 8,  # Keep-alive connections held open to docs.google.com
+    'ROW_CACHE_SIZE': 2048,  # Rendered athlete cards kept for reuse across reruns
+    # Fetch all competitions in one XLSX export, with per-sheet CSV as fallback;
+    # enable once WORKBOOK_TABS holds the spreadsheet's real tab titles
+    'WORKBOOK_FETCH': False,
+    'MAX_FETCH_WORKERS': 8,
+    'SNAPSHOT_DB': 'snapshots.db',  # SQLite history of every distinct sheet snapshot, used to warm-start; None disables
+    'DEBUG_PANEL': False,  # Show stage timings in the sidebar; also enabled per visit with ?debug=1
+    'METRICS_PORT': None,  # Serve Prometheus metrics on 127.0.0.1:<port>/metrics; None disables
+    'NATIVE_FINISH_BOUNDS': True,  # Compute boulder worst finishes from scores instead of the sheet's 'Worst Possible Finish'
+    'NATIVE_BOULDER_STRATEGY': True,  # Compute last-boulder strategies from scores instead of the sheet's strategy columns
+    'NATIVE_LEAD_THRESHOLDS': True,  # Compute lead thresholds from posted scores; the sheet's helper rows are the fallback
+    'SIMULATION_SCENARIOS': 20000,  # Monte Carlo scenarios per sheet for top 3 / top 8 chances; 0 disables
+    'SIMULATION_BUDGET': 0.25,  # Seconds of simulation allowed per sheet, whatever the scenario count
 }
 
+class MetricsRegistry:
+    """Thread-safe latency histograms and counters for the fetch, parse and render hot paths.
+    
+    Series are keyed by metric name plus label values. Collectors registered with
+    add_collector() are read at exposition time, for stats owned by other objects.
+    """
+    
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._collectors = []
+    
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {'buckets': [0] * (len(self.BUCKETS) + 1), 'sum': 0.0, 'count': 0}
+            histogram['buckets'][bisect.bisect_left(self.BUCKETS, seconds)] += 1
+            histogram['sum'] += seconds
+            histogram['count'] += 1
+    
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+    
+    @contextmanager
+    def timer(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+    
+    def add_collector(self, collect):
+        """Register a callable returning `[(name, labels, value), ...]` counters to export"""
+        self._collectors.append(collect)
+    
+    def quantile(self, histogram, q):
+        """Estimate a quantile from bucket counts, interpolating within the bucket like Prometheus"""
+        rank = q * histogram['count']
+        cumulative = 0
+        for i, count in enumerate(histogram['buckets']):
+            if count and cumulative + count >= rank:
+                if i == len(self.BUCKETS):
+                    return self.BUCKETS[-1]
+                lower = self.BUCKETS[i - 1] if i else 0.0
+                return lower + (self.BUCKETS[i] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return 0.0
+    
+    def histogram_summary(self):
+        """Return `[(name, labels, count, mean, p50, p95), ...]` with times in seconds"""
+        with self._lock:
+            histograms = {key: dict(value, buckets=list(value['buckets'])) for key, value in self._histograms.items()}
+        return [
+            (name, dict(labels), h['count'], h['sum'] / h['count'], self.quantile(h, 0.5), self.quantile(h, 0.95))
+            for (name, labels), h in sorted(histograms.items())
+        ]
+    
+    def counters(self):
+        """Return `[(name, labels, value), ...]` including collected counters"""
+        with self._lock:
+            counters = [(name, dict(labels), value) for (name, labels), value in sorted(self._counters.items())]
+        for collect in self._collectors:
+            counters.extend(collect())
+        return counters
+    
+    def render_prometheus(self):
+        """Export every series in the Prometheus text exposition format"""
+        def label_text(labels, **extra):
+            pairs = {**labels, **extra}
+            return "{" + ",".join(f'{key}="{value}"' for key, value in pairs.items()) + "}" if pairs else ""
+        
+        with self._lock:
+            histograms = sorted((key, dict(value, buckets=list(value['buckets']))) for key, value in self._histograms.items())
+        lines = []
+        typed = set()
+        for (name, labels), h in histograms:
+            labels = dict(labels)
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            cumulative = 0
+            for bound, count in zip(self.BUCKETS + ('+Inf',), h['buckets']):
+                cumulative += count
+                lines.append(f"{name}_bucket{label_text(labels, le=bound)} {cumulative}")
+            lines.append(f"{name}_sum{label_text(labels)} {h['sum']}")
+            lines.append(f"{name}_count{label_text(labels)} {h['count']}")
+        for name, labels, value in self.counters():
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{label_text(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+def stage_timer(metrics, stage, **labels):
+    """Time a hot-path stage into `metrics`, or do nothing when no registry is passed"""
+    if metrics is None:
+        return nullcontext()
+    return metrics.timer('dashboard_stage_seconds', stage=stage, **labels)
+
+def serve_metrics(metrics, port):
+    """Serve `metrics` in Prometheus text format at http://127.0.0.1:<port>/metrics from a daemon thread"""
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != '/metrics':
+                self.send_error(404)
+                return
+            body = metrics.render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(('127.0.0.1', port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"Serving metrics on http://127.0.0.1:{port}/metrics")
+    return server
+
 def safe_numeric_conversion(value, default=0):
     """Safely convert value to numeric with proper error handling"""
     try:
@@ -269,19 +442,47 @@ def safe_numeric_conversion(value, default=0):
         logger.warning(f"Error converting {value} to numeric: {e}")
         return default
 
-def clean_text(text):
-    """Clean text by removing unwanted characters and normalizing"""
-    if not isinstance(text, str):
-        return str(text) if text is not None else ""
+# Encoding artifacts left by double-encoded UTF-8 exports, replaced in this order
+TEXT_ARTIFACTS = (
+    ("ÃƒÆ'Ã‚Â¢", ''),
+    ("ÃƒÆ'Ã‚Â¡", ''),
+    ('ÃƒÂ¢Ã¢â€šÂ¬Ã¢â€žÂ¢', "'"),
+    ('ÃƒÂ¢Ã¢â€šÂ¬Ã…"', '"'),
+    ('ÃƒÂ¢Ã¢â€šÂ¬', '"'),
+    ('ÃƒÂ¢Ã¢â€šÂ¬"', '-'),
+)
+TEXT_ARTIFACT_MARKER = 'Ãƒ'  # Shared prefix of every artifact, used as a cheap pre-check
+
+def clean_text_columns(df):
+    """Clean every text cell in one vectorized pass: fix encoding artifacts and strip.
     
+    Runs once at ingest, so renderers can use cell values as-is. Missing cells stay missing.
+    """
+    text_positions = [i for i, dtype in enumerate(df.dtypes) if dtype == object or pd.api.types.is_string_dtype(dtype)]
+    if not text_positions:
+        return df
+    
+    # All text cells go through Arrow as one array, so each step is a single kernel call
+    block = df.iloc[:, text_positions].to_numpy(dtype=object)
+    missing = pd.isna(block)
     try:
-        # Remove common encoding artifacts
-        cleaned = text.replace('ÃƒÆ'Ã‚Â¢', '').replace('ÃƒÆ'Ã‚Â¡', '').replace('ÃƒÂ¢Ã¢â€šÂ¬Ã¢â€žÂ¢', "'")
-        cleaned = cleaned.replace('ÃƒÂ¢Ã¢â€šÂ¬Ã…"', '"').replace('ÃƒÂ¢Ã¢â€šÂ¬', '"').replace('ÃƒÂ¢Ã¢â€šÂ¬"', '-')
-        return cleaned.strip()
-    except Exception as e:
-        logger.warning(f"Error cleaning text '{text}': {e}")
-        return str(text) if text is not None else ""
+        cells = pa.array(block.ravel(), type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed object columns (numbers next to text) are cleaned as their string form
+        cells = pa.array(np.where(missing, None, block.astype(str)).ravel(), type=pa.string())
+    
+    if pc.any(pc.match_substring(cells, TEXT_ARTIFACT_MARKER)).as_py():
+        for artifact, replacement in TEXT_ARTIFACTS:
+            cells = pc.replace_substring(cells, artifact, replacement)
+    cells = pc.utf8_trim_whitespace(cells)
+    
+    cleaned = np.where(missing, block, cells.to_numpy(zero_copy_only=False).reshape(block.shape))
+    block_index = {position: j for j, position in enumerate(text_positions)}
+    columns = {
+        col: cleaned[:, block_index[i]] if i in block_index else df.iloc[:, i]
+        for i, col in enumerate(df.columns)
+    }
+    return pd.DataFrame(columns, index=df.index)
 
 def validate_dataframe(df, expected_columns):
     """Validate DataFrame has expected structure"""
@@ -296,6 +497,105 @@ def validate_dataframe(df, expected_columns):
     
     return len(issues) == 0, issues
 
+# Columns every consumer understands, per discipline; anything else in a sheet is ignored
+EXPECTED_COLUMNS = {
+    "Boulder": ('Athlete Name', 'Current Position/Rank', 'Total Score'),
+    "Lead": ('Name', 'Manual Score', 'Current Rank', 'Status', 'Worst Finish'),
+}
+THRESHOLD_COLUMNS = ('Hold for 1st', 'Hold for 2nd', 'Hold for 3rd', 'Hold to Qualify', 'Min to Qualify')
+STRATEGY_PLACES = ('1st', '2nd', '3rd')
+STRATEGY_TARGETS = {'1st': 1, '2nd': 2, '3rd': 3, 'Qualify': 8}  # Places the native last-boulder strategy covers
+
+@dataclass(frozen=True)
+class SheetSchema:
+    """Resolved column roles for one sheet header, so consumers never rescan `df.columns`.
+    
+    `score_cols` is every column with 'Score' in its name (used for round status),
+    `problem_score_cols` those that also mention 'Boulder' (completed problems), and
+    `boulder_score_cols` the numbered `Boulder N Score (0-25)` columns as `(n, column)`.
+    """
+    discipline: str
+    total_score_col: str = None
+    worst_finish_col: str = None
+    score_cols: tuple = ()
+    problem_score_cols: tuple = ()
+    boulder_score_cols: tuple = ()
+    strategy_cols: tuple = ()
+    threshold_cols: tuple = ()
+    missing: tuple = ()
+    unknown: tuple = ()
+
+def competition_discipline(competition_name):
+    """Return 'Boulder', 'Lead' or '' for a competition name"""
+    if "Boulder" in competition_name:
+        return "Boulder"
+    if "Lead" in competition_name:
+        return "Lead"
+    return ""
+
+@lru_cache(maxsize=64)
+def resolve_sheet_schema(discipline, columns):
+    """Map a sheet header tuple to its column roles, once per distinct header.
+    
+    Missing and unrecognized columns are logged here, so they are reported once per
+    header change rather than on every rerun. Schemas are resolved at ingest on the
+    poller thread, where Streamlit caches are unavailable, hence a plain LRU.
+    """
+    total_score_col = next((col for col in columns if 'Total Score' in str(col)), None)
+    
+    if discipline == "Boulder" and 'Worst Possible Finish' in columns:
+        worst_finish_col = 'Worst Possible Finish'
+    elif discipline == "Lead" and 'Worst Finish' in columns:
+        worst_finish_col = 'Worst Finish'
+    else:
+        # Try other variations as fallback
+        worst_finish_col = next((
+            col for col in columns
+            if 'worst' in str(col).strip().lower() and 'finish' in str(col).strip().lower()
+        ), None)
+    
+    # Strategy headers are sometimes truncated to "... Place Strate"
+    strategy_cols = {}
+    for col in columns:
+        for place in STRATEGY_PLACES:
+            if f'{place} Place Strate' in str(col):
+                strategy_cols[place] = col
+                break
+    
+    schema = SheetSchema(
+        discipline=discipline,
+        total_score_col=total_score_col,
+        worst_finish_col=worst_finish_col,
+        score_cols=tuple(col for col in columns if 'Score' in str(col)),
+        problem_score_cols=tuple(col for col in columns if 'Boulder' in str(col) and 'Score' in str(col)),
+        boulder_score_cols=tuple(
+            (i, f'Boulder {i} Score (0-25)') for i in range(1, 5) if f'Boulder {i} Score (0-25)' in columns
+        ),
+        strategy_cols=tuple(strategy_cols.items()),
+        threshold_cols=tuple(col for col in THRESHOLD_COLUMNS if col in columns),
+    )
+    
+    expected = EXPECTED_COLUMNS.get(discipline, ())
+    known = set(expected) | set(schema.score_cols) | set(THRESHOLD_COLUMNS)
+    known.update(col for _, col in schema.strategy_cols)
+    if worst_finish_col:
+        known.add(worst_finish_col)
+    schema = replace(
+        schema,
+        missing=tuple(col for col in expected if col not in columns),
+        unknown=tuple(col for col in columns if col not in known),
+    )
+    
+    if schema.missing:
+        logger.warning(f"{discipline or 'Sheet'} header is missing columns: {', '.join(schema.missing)}")
+    if schema.unknown:
+        logger.info(f"{discipline or 'Sheet'} header has unrecognized columns: {', '.join(map(str, schema.unknown))}")
+    return schema
+
+def get_sheet_schema(df, competition_name):
+    """Resolved schema for a competition's DataFrame"""
+    return resolve_sheet_schema(competition_discipline(competition_name), tuple(df.columns))
+
 def get_competition_status(df, competition_name):
     """Determine competition status based on data"""
     if df.empty:
@@ -303,7 +603,7 @@ def get_competition_status(df, competition_name):
     
     # Check if there are any scores/results
     if "Boulder" in competition_name:
-        score_cols = [col for col in df.columns if 'Score' in str(col)]
+        score_cols = list(get_sheet_schema(df, competition_name).score_cols)
         if score_cols:
             has_scores = df[score_cols].notna().any().any()
             if has_scores:
@@ -327,65 +627,1177 @@ def get_competition_status(df, competition_name):
     
     return "upcoming", "🔄"
 
-@st.cache_data(ttl=CONFIG['CACHE_TTL'])
-def load_sheet_data(url, retries=0):
-    """Load data from Google Sheets CSV export URL with enhanced error handling"""
+class FinishBounds:
+    """Worst and best possible finish of every athlete in a boulder round, kept up to date incrementally"""
+    MAX_BOULDER_SCORE = 25
+    
+    def __init__(self, names, totals, remaining):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        # Final totals lie between the current total and 25 more per outstanding boulder
+        self.low = np.asarray(totals, dtype=float)
+        self.high = self.low + self.MAX_BOULDER_SCORE * np.asarray(remaining, dtype=float)
+        self._low_sorted = np.sort(self.low)
+        self._high_sorted = np.sort(self.high)
+        # Worst: rivals whose ceiling reaches my floor (ties count against me);
+        # best: rivals whose floor is already above my ceiling
+        n = len(self.low)
+        self.worst = n - np.searchsorted(self._high_sorted, self.low, side='left')
+        self.best = 1 + n - np.searchsorted(self._low_sorted, self.high, side='right')
+    
+    def copy(self):
+        bounds = object.__new__(FinishBounds)
+        bounds.names, bounds.index = self.names, self.index
+        for attr in ('low', 'high', '_low_sorted', '_high_sorted', 'worst', 'best'):
+            setattr(bounds, attr, getattr(self, attr).copy())
+        return bounds
+    
+    def update(self, name, total, remaining):
+        """Apply one athlete's new total and outstanding boulders in place"""
+        i = self.index[name]
+        old_low, old_high = self.low[i], self.high[i]
+        new_low = float(total)
+        new_high = new_low + self.MAX_BOULDER_SCORE * remaining
+        
+        # Rivals' worst finish depends on this athlete's ceiling, their best on its floor
+        others = np.ones(len(self.low), dtype=bool)
+        others[i] = False
+        self.worst += others & (new_high >= self.low)
+        self.worst -= others & (old_high >= self.low)
+        self.best += others & (new_low > self.high)
+        self.best -= others & (old_low > self.high)
+        
+        self._low_sorted = self._resorted(self._low_sorted, old_low, new_low)
+        self._high_sorted = self._resorted(self._high_sorted, old_high, new_high)
+        self.low[i], self.high[i] = new_low, new_high
+        n = len(self.low)
+        self.worst[i] = n - np.searchsorted(self._high_sorted, new_low, side='left')
+        self.best[i] = 1 + n - np.searchsorted(self._low_sorted, new_high, side='right')
+    
+    @staticmethod
+    def _resorted(values, old, new):
+        values = np.delete(values, np.searchsorted(values, old))
+        return np.insert(values, np.searchsorted(values, new), new)
+    
+    def updated(self, names, totals, remaining, max_changes=8):
+        """Bounds for a new state of the round: a copy updated per changed athlete, or rebuilt past `max_changes`"""
+        names = list(names)
+        totals = np.asarray(totals, dtype=float)
+        remaining = np.asarray(remaining, dtype=float)
+        if names == self.names:
+            order = np.arange(len(names))
+        else:
+            order = np.fromiter((self.index.get(name, -1) for name in names), dtype=int, count=len(names))
+        if len(names) != len(self.names) or (order < 0).any():
+            return FinishBounds(names, totals, remaining)
+        highs = totals + self.MAX_BOULDER_SCORE * remaining
+        changed = np.flatnonzero((self.low[order] != totals) | (self.high[order] != highs))
+        if changed.size > max_changes:
+            return FinishBounds(names, totals, remaining)
+        bounds = self.copy()
+        for j in changed:
+            bounds.update(names[j], totals[j], remaining[j])
+        return bounds
+    
+    def _order(self, names):
+        return np.fromiter((self.index[name] for name in names), dtype=int, count=len(names))
+    
+    def for_names(self, names):
+        """(worst, best) arrays aligned to `names`"""
+        order = self._order(names)
+        return self.worst[order], self.best[order]
+    
+    def last_boulder_targets(self, names, places):
+        """Minimum last-boulder score each athlete needs to be sure of each place or better.
+        
+        Returns {place: float array aligned to `names`}: NaN for athletes without
+        exactly one boulder left, <= 0 when the place is already secured and > 25 when
+        it is out of reach. Being sure of a place means beating that many rivals'
+        ceilings, so ties again count against the athlete.
+        """
+        order = self._order(names)
+        low, high = self.low[order], self.high[order]
+        one_left = np.isclose(high - low, self.MAX_BOULDER_SCORE)
+        descending = self._high_sorted[::-1]
+        # The athlete's own ceiling sits after every strictly higher one
+        above = len(descending) - np.searchsorted(self._high_sorted, high, side='right')
+        padded = np.append(descending, -np.inf)
+        targets = {}
+        for place in places:
+            rival = padded[np.minimum(np.where(place - 1 < above, place - 1, place), len(descending))]
+            targets[place] = np.where(one_left, np.round(rival - low + 0.1, 1), np.nan)
+        return targets
+
+def boulder_target_text(needed):
+    """Describe a minimum last-boulder score as the result that achieves it: 24.9 -> 'Top in 2 (24.9)'"""
+    if needed <= 0:
+        return "Secured"
+    if needed > FinishBounds.MAX_BOULDER_SCORE:
+        return "Out of reach"
+    result, best = ("Zone", 10) if needed <= 10 else ("Top", 25)
+    attempts = int(round((best - needed) * 10)) + 1
+    return f"{result} in {attempts} ({needed:.1f})" if attempts < 10 else f"{result} ({needed:.1f})"
+
+LEAD_TOP_SCORE = 1000.0  # Value of a topped route, above any hold number
+
+def lead_score_value(score):
+    """Numeric lead score, with a trailing '+' (a usable hold) worth half a hold.
+    
+    NaN only when the cell is empty, so every climber with a score counts as done:
+    'TOP' ranks above every hold and other text (e.g. 'DNS') below all of them.
+    """
+    if pd.isna(score):
+        return np.nan
+    text = str(score).strip()
+    if not text:
+        return np.nan
+    if text.upper() == 'TOP':
+        return LEAD_TOP_SCORE
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        value = float(text.rstrip('+'))
+    except ValueError:
+        return 0.0
+    return value + 0.5 if text.endswith('+') else value
+
+def format_lead_score(value):
+    """Inverse of lead_score_value for display: 41.5 -> '41+', a top (or beyond) -> 'TOP'"""
+    if value >= LEAD_TOP_SCORE:
+        return "TOP"
+    hold = int(value)
+    return f"{hold}+" if value - hold >= 0.5 else str(hold)
+
+class LeadThresholdCalculator:
+    """Lead thresholds computed from the scores posted so far, instead of sheet helper rows.
+    
+    Posted scores are kept in an ascending list, so the score needed to pass the
+    k-th best is an index lookup and each new score is a single bisect insertion.
+    A threshold is the lowest score that strictly beats the one it must pass, ties
+    counting against the climber.
+    """
+    QUALIFYING_PLACES = 8
+    
+    def __init__(self):
+        self.scores = {}
+        self.sorted = []
+    
+    def post(self, athlete, value):
+        """Record, replace or (with NaN) withdraw one athlete's score"""
+        old = self.scores.pop(athlete, None)
+        if old is not None:
+            del self.sorted[bisect.bisect_left(self.sorted, old)]
+        if not np.isnan(value):
+            self.scores[athlete] = value
+            bisect.insort(self.sorted, value)
+    
+    def updated(self, scores):
+        """A copy brought up to date with `scores` ({athlete: value}), posting only what changed"""
+        calculator = LeadThresholdCalculator()
+        calculator.scores, calculator.sorted = dict(self.scores), list(self.sorted)
+        for athlete in self.scores.keys() - scores.keys():
+            calculator.post(athlete, np.nan)
+        for athlete, value in scores.items():
+            old = self.scores.get(athlete)
+            if (old is None and np.isnan(value)) or old == value:
+                continue
+            calculator.post(athlete, value)
+        return calculator
+    
+    def needed(self, place):
+        """Lowest score that passes the current `place`-th best; None when fewer have climbed"""
+        if place > len(self.sorted):
+            return None
+        return self.sorted[-place] + 0.5
+    
+    def thresholds(self, competition_name, waiting):
+        """(threshold column, value) pairs for the next climber, with `waiting` athletes yet to climb.
         
-        response = requests.get(
+        'Min to Qualify' passes the current last qualifier; 'Hold to Qualify' stays
+        inside the cut even if everyone climbing later finishes ahead.
+        """
+        if not self.sorted:
+            return ()
+        places = [(1, 'Hold for 1st'), (2, 'Hold for 2nd'), (3, 'Hold for 3rd')]
+        if "Final" not in competition_name:
+            rivals_left = max(waiting - 1, 0)
+            if self.QUALIFYING_PLACES - rivals_left >= 1:
+                places.append((self.QUALIFYING_PLACES - rivals_left, 'Hold to Qualify'))
+            places.append((self.QUALIFYING_PLACES, 'Min to Qualify'))
+        found = []
+        for place, col in places:
+            value = self.needed(place)
+            found.append((col, format_lead_score(value) if value is not None else "Any"))
+        return tuple(found)
+
+@lru_cache(maxsize=32)
+def simulate_cut_probabilities(content_hash, cut, current, outstanding, pool):
+    """Monte Carlo chance of each athlete finishing in the top `cut`; returns (probabilities, scenarios run).
+    
+    Each of an athlete's `outstanding` results is drawn from `pool`, the results posted so far.
+    """
+    current, outstanding, pool = np.asarray(current), np.asarray(outstanding), np.asarray(pool)
+    n = len(current)
+    if n <= cut:
+        return (1.0,) * n, 0
+    # Seeded per content hash so a sheet's odds stay stable across rebuilds
+    rng = np.random.default_rng(int.from_bytes(hashlib.sha256(content_hash.encode()).digest()[:8], 'little'))
+    pending = np.arange(outstanding.max()) < outstanding[:, None]
+    inside = np.zeros(n)
+    runs, total = 0, CONFIG['SIMULATION_SCENARIOS']
+    deadline = time.perf_counter() + CONFIG['SIMULATION_BUDGET']
+    # Batches until the scenario count or the time budget runs out; the noise breaks ties at random
+    while runs < total and (runs == 0 or time.perf_counter() < deadline):
+        batch = min(2000, total - runs)
+        draws = pool[rng.integers(len(pool), size=(batch, *pending.shape))]
+        finals = current + (draws * pending).sum(axis=2) + rng.random((batch, n)) * 1e-6
+        top = np.argpartition(-finals, cut - 1, axis=1)[:, :cut]
+        inside += np.bincount(top.ravel(), minlength=n)
+        runs += batch
+    return tuple(inside / runs), runs
+
+def lead_finish_bounds(values):
+    """(worst, best) possible finish of each lead climber from the scores posted so far.
+    
+    `values` holds lead_score_value() results, NaN for climbers still waiting; their
+    bounds are NaN. The worst case has every waiting climber finish ahead, with ties
+    counted against the climber as for FinishBounds.
+    """
+    values = np.asarray(values, dtype=float)
+    scored = ~np.isnan(values)
+    posted = np.sort(values[scored])
+    worst = np.full(len(values), np.nan)
+    best = np.full(len(values), np.nan)
+    worst[scored] = len(posted) - np.searchsorted(posted, values[scored], side='left') + (~scored).sum()
+    best[scored] = 1 + len(posted) - np.searchsorted(posted, values[scored], side='right')
+    return worst, best
+
+def cut_chance_text(cut, probability, worst, best):
+    """Card text for a simulated chance; 100% and 0% only when the finish bounds prove it"""
+    if worst <= cut:
+        return f"Top {cut}: 100%"
+    if best > cut:
+        return f"Top {cut}: 0%"
+    if probability >= 0.995:
+        return f"Top {cut}: >99%"
+    if probability < 0.005:
+        return f"Top {cut}: <1%"
+    return f"Top {cut}: {probability:.0%}"
+
+def with_cut_chances(standings, competition_name, content_hash, current, outstanding, pool, worst, best):
+    """Add each athlete's simulated chance of making the podium (Finals) or the top 8.
+    
+    Sets `cut_probability` and its card text `cut_chance`; they stay NaN and ''
+    when the round has nothing left to simulate or simulation is disabled. `worst`
+    and `best` are the possible finishes (NaN when unknown) that certain outcomes
+    are checked against.
+    """
+    cut = 3 if "Final" in competition_name else 8
+    standings = standings.assign(cut_probability=np.nan, cut_chance='')
+    outstanding = np.asarray(outstanding, dtype=int)
+    pool = np.asarray(pool, dtype=float)
+    pool = pool[~np.isnan(pool)]
+    if not CONFIG['SIMULATION_SCENARIOS'] or not outstanding.any() or not pool.size:
+        return standings
+    probabilities, runs = simulate_cut_probabilities(
+        content_hash, cut, tuple(np.asarray(current, dtype=float)), tuple(outstanding), tuple(pool)
+    )
+    logger.debug(f"{competition_name}: {runs} scenarios simulated")
+    standings['cut_probability'] = probabilities
+    if len(standings) <= cut:
+        worst = np.ones(len(standings))
+    standings['cut_chance'] = [
+        cut_chance_text(cut, probability, worst_finish, best_finish)
+        for probability, worst_finish, best_finish in zip(probabilities, np.asarray(worst), np.asarray(best))
+    ]
+    return standings
+
+@dataclass(frozen=True)
+class CompetitionSnapshot:
+    """Typed, immutable view of one competition, built once per sheet content hash.
+    
+    Everything rendering needs is derived here at ingest, so reruns only format HTML.
+    `standings` holds the athletes in display order (boulder rows already classified),
+    with `ranks` and `scores` as float arrays aligned to it (NaN where not numeric).
+    """
+    name: str
+    df: pd.DataFrame
+    schema: SheetSchema
+    content_hash: str = ""
+    status: str = "upcoming"
+    status_emoji: str = "🔄"
+    issues: tuple = ()  # Validation problems; nothing below is set when there are any
+    standings: pd.DataFrame = None
+    ranks: np.ndarray = None
+    scores: np.ndarray = None
+    active_mask: np.ndarray = None  # Lead: rows of `df` that are athletes, not helper rows
+    total_athletes: int = 0
+    completed: int = 0  # Boulder: scored problems; Lead: athletes with a score
+    avg_score: float = 0
+    leader: str = "TBD"
+    thresholds: tuple = ()  # Lead: (threshold column, value) pairs, computed or from the helper rows
+    finish_bounds: FinishBounds = None  # Boulder: possible finishes, updated incrementally by the next build
+    threshold_calculator: LeadThresholdCalculator = None  # Lead: posted scores, updated incrementally by the next build
+    simulated: bool = False  # Whether `standings` carry the simulated chances of simulate_competition()
+
+def numeric_values(series):
+    """Float array of a column, with non-numeric cells as NaN"""
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+
+def mean_or_zero(values):
+    """Mean of the numeric values, or 0 when there are none"""
+    present = values[~np.isnan(values)]
+    return present.mean() if present.size else 0
+
+def lead_active_mask(df):
+    """Rows of a lead sheet that are athletes rather than blank or threshold rows"""
+    names = df['Name']
+    text = names.astype(str)
+    return (
+        names.notna() &
+        (names != '') &
+        (~text.str.isdigit()) &
+        (~text.str.contains('Hold for', na=False)) &
+        (~text.str.contains('Min to', na=False))
+    ).to_numpy(dtype=bool)
+
+def lead_thresholds(df, schema):
+    """Qualification thresholds from the bottom rows of a lead sheet as (column, value) pairs.
+    
+    The last value of each column wins; pairs are ordered by the row they first appear in.
+    """
+    named = df['Name'].notna() & (df['Name'] != '')
+    found = []
+    for order, col in enumerate(schema.threshold_cols):
+        positions = np.flatnonzero((named & df[col].notna()).to_numpy(dtype=bool))
+        if positions.size:
+            found.append((positions[0], order, col, str(df[col].iloc[positions[-1]])))
+    return tuple((col, value) for _, _, col, value in sorted(found))
+
+def build_boulder_snapshot(snapshot, previous=None):
+    """Validate, classify and summarize a boulder sheet, updating `previous`'s finish bounds"""
+    df, schema = snapshot.df, snapshot.schema
+    is_valid, issues = validate_dataframe(df, ['Athlete Name', 'Current Position/Rank'])
+    if not is_valid:
+        return replace(snapshot, issues=tuple(issues))
+    
+    score_col = schema.total_score_col
+    names = df['Athlete Name']
+    leaders = names[numeric_values(df['Current Position/Rank']) == 1]
+    previous_bounds = previous.finish_bounds if previous is not None else None
+    standings, bounds = classify_boulder_standings(df, snapshot.name, schema, previous_bounds)
+    return replace(
+        snapshot,
+        standings=standings,
+        finish_bounds=bounds,
+        ranks=numeric_values(standings['Current Position/Rank']),
+        scores=numeric_values(standings[score_col]) if score_col else np.full(len(standings), np.nan),
+        total_athletes=int((names.notna() & (names != '')).sum()),
+        completed=int(sum(df[col].notna().sum() for col in schema.problem_score_cols)),
+        avg_score=mean_or_zero(numeric_values(df[score_col])) if score_col else 0,
+        leader=leaders.iloc[0] if len(leaders) else "TBD",
+    )
+
+def build_lead_snapshot(snapshot, previous=None):
+    """Separate athletes from threshold rows of a lead sheet, then rank and summarize them"""
+    df = snapshot.df
+    if 'Name' not in df.columns:
+        return replace(snapshot, issues=("Name column not found in data",))
+    
+    active_mask = lead_active_mask(df)
+    active_df = df[active_mask]
+    
+    completed = 0
+    avg_score = 0
+    if 'Manual Score' in df.columns:
+        scores = active_df['Manual Score']
+        completed = int((scores.notna() & (scores != '')).sum())
+        avg_score = mean_or_zero(numeric_values(scores))
+    
+    leader = "TBD"
+    standings = active_df.reset_index(drop=True)
+    if 'Current Rank' in df.columns:
+        ranks = pd.to_numeric(active_df['Current Rank'], errors='coerce')
+        leaders = active_df.loc[ranks == 1, 'Name']
+        if len(leaders):
+            leader = leaders.iloc[0]
+        standings = active_df.assign(**{'Current Rank': ranks})
+        standings = standings.sort_values('Current Rank', ascending=True).reset_index(drop=True)
+    
+    # Thresholds from the posted scores, updating the previous build's sorted scores
+    calculator = None
+    thresholds = lead_thresholds(df, snapshot.schema)
+    if CONFIG['NATIVE_LEAD_THRESHOLDS'] and 'Manual Score' in df.columns:
+        names = active_df['Name']
+        athletes = zip(names, names.groupby(names).cumcount())
+        scores = dict(zip(athletes, active_df['Manual Score'].map(lead_score_value)))
+        previous_calculator = previous.threshold_calculator if previous is not None else None
+        calculator = (previous_calculator or LeadThresholdCalculator()).updated(scores)
+        waiting = sum(np.isnan(value) for value in scores.values())
+        thresholds = calculator.thresholds(snapshot.name, waiting) or thresholds
+    
+    return replace(
+        snapshot,
+        standings=standings,
+        ranks=numeric_values(standings['Current Rank']) if 'Current Rank' in df.columns else np.full(len(standings), np.nan),
+        scores=numeric_values(standings['Manual Score']) if 'Manual Score' in df.columns else np.full(len(standings), np.nan),
+        active_mask=active_mask,
+        total_athletes=len(active_df),
+        completed=completed,
+        avg_score=avg_score,
+        leader=leader,
+        thresholds=thresholds,
+        threshold_calculator=calculator,
+    )
+
+def simulate_competition(snapshot):
+    """Add simulated top 3 / top 8 chances to a built snapshot's standings.
+    
+    Separate from the build so snapshots built on the script thread (warm starts,
+    replays) can skip it; the poller adds them on its own thread later.
+    """
+    standings = snapshot.standings
+    if snapshot.finish_bounds is not None:
+        schema = snapshot.schema
+        posted = np.concatenate([numeric_values(snapshot.df[col]) for _, col in schema.boulder_score_cols])
+        outstanding = len(schema.boulder_score_cols) - standings['completed_boulders']
+        standings = with_cut_chances(
+            standings, snapshot.name, snapshot.content_hash, standings['current_total'], outstanding, posted,
+            standings['worst_possible'], standings['best_possible']
+        )
+    elif snapshot.schema.discipline == "Lead" and standings is not None and 'Manual Score' in standings.columns:
+        values = standings['Manual Score'].map(lead_score_value).to_numpy(dtype=float)
+        standings = with_cut_chances(
+            standings, snapshot.name, snapshot.content_hash, np.nan_to_num(values), np.isnan(values), values,
+            *lead_finish_bounds(values)
+        )
+    return replace(snapshot, standings=standings, simulated=True)
+
+def build_competition_snapshot(competition_name, df, content_hash="", previous=None, simulate=True):
+    """Parse a freshly loaded sheet into its typed snapshot; called once per content hash.
+    
+    `previous` is the last snapshot of the same competition, whose derived state
+    is updated incrementally where possible. With `simulate` off the Monte Carlo
+    chances are left out (see simulate_competition()).
+    """
+    status, status_emoji = get_competition_status(df, competition_name)
+    snapshot = CompetitionSnapshot(
+        competition_name, df, get_sheet_schema(df, competition_name), content_hash, status, status_emoji
+    )
+    if df.empty:
+        return snapshot
+    if snapshot.schema.discipline == "Boulder":
+        snapshot = build_boulder_snapshot(snapshot, previous)
+    elif snapshot.schema.discipline == "Lead":
+        snapshot = build_lead_snapshot(snapshot, previous)
+    return simulate_competition(snapshot) if simulate and not snapshot.issues else snapshot
+
+def prepare_sheet_frame(df):
+    """Clean a freshly parsed sheet: drop empty rows and helper columns, normalize text"""
+    # Clean up the dataframe
+    df = df.dropna(how='all')
+    
+    # Clean column names - strip whitespace and normalize
+    df.columns = df.columns.astype(str).str.strip()
+    
+    # Remove unnamed columns more safely
+    if len(df.columns) > 0:
+        unnamed_cols = [col for col in df.columns if str(col).startswith('Unnamed')]
+        df = df.drop(columns=unnamed_cols, errors='ignore')
+    
+    # Clean text data
+    return clean_text_columns(df)
+
+def sheet_columns(header, discipline):
+    """Names of the header columns worth loading, stripped and in sheet order.
+    
+    Blank and 'Unnamed' helper columns are always left out; for Boulder and Lead
+    sheets so are the columns whose role no consumer knows.
+    """
+    names = [str(col).strip() for col in header]
+    names = [name for name in names if name and not name.startswith('Unnamed')]
+    if not discipline:
+        return names
+    unknown = set(resolve_sheet_schema(discipline, tuple(names)).unknown)
+    return [name for name in names if name not in unknown]
+
+def sheet_text_columns(schema):
+    """Columns kept as text whatever their cells look like: names, statuses, finishes, thresholds, strategies"""
+    text_cols = {'Athlete Name', 'Name', 'Status', schema.worst_finish_col, *schema.threshold_cols}
+    text_cols.update(col for _, col in schema.strategy_cols)
+    text_cols.discard(None)
+    return text_cols
+
+def as_text(values):
+    """Cast a Series to strings with missing cells kept missing (pandas 2 would write 'None')"""
+    return values.astype('str').where(values.notna())
+
+def cell_text(value):
+    """A cell as the CSV export spells it: whole numbers without the '.0' XLSX gives them"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def cast_text_columns(df, schema):
+    """Type the text columns of a parsed sheet as strings, so every fetch path yields the same frame.
+    
+    Columns Arrow already read as strings are left alone; numbers from XLSX cells and
+    all-empty columns are converted, with missing cells kept missing.
+    """
+    for col in sheet_text_columns(schema):
+        if col in df.columns and not isinstance(df[col].dtype, pd.StringDtype):
+            df[col] = as_text(df[col].map(cell_text, na_action='ignore'))
+    return df
+
+def parse_sheet_csv_pandas(content, columns, metrics=None):
+    """Parse a CSV export body with pandas, keeping only `columns` (stripped names)"""
+    try:
+        with stage_timer(metrics, 'read_csv', engine='pandas'):
+            df = pd.read_csv(BytesIO(content), usecols=lambda col: str(col).strip() in columns)
+    except pd.errors.EmptyDataError:
+        logger.warning("The data source appears to be empty")
+        return pd.DataFrame()
+    with stage_timer(metrics, 'clean_text'):
+        return prepare_sheet_frame(df)
+
+def parse_sheet_csv(content, discipline="", metrics=None):
+    """Parse a single-sheet CSV export body into a cleaned DataFrame.
+    
+    Arrow parses the bytes directly and only materializes the columns sheet_columns()
+    keeps; text columns are typed as strings up front so they are never inferred.
+    Headers Arrow cannot select by name (duplicates) and malformed bodies go through
+    pandas instead.
+    """
+    header = next(csv.reader(TextIOWrapper(BytesIO(content), encoding='utf-8-sig', newline='')), [])
+    if not header:
+        logger.warning("The data source appears to be empty")
+        return pd.DataFrame()
+    
+    columns = sheet_columns(header, discipline)
+    schema = resolve_sheet_schema(discipline, tuple(columns))
+    selected = [col for col in header if col.strip() in columns]
+    if len(set(col.strip() for col in selected)) != len(selected):
+        return cast_text_columns(parse_sheet_csv_pandas(content, set(columns), metrics), schema)
+    
+    text_cols = sheet_text_columns(schema)
+    try:
+        with stage_timer(metrics, 'read_csv', engine='arrow'):
+            table = pa_csv.read_csv(BytesIO(content), convert_options=pa_csv.ConvertOptions(
+                include_columns=selected,
+                column_types={col: pa.string() for col in selected if col.strip() in text_cols},
+                strings_can_be_null=True
+            ))
+            # Columns without a single value come back untyped; pandas reads those as float NaN
+            for i, field in enumerate(table.schema):
+                if pa.types.is_null(field.type):
+                    table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+            df = table.to_pandas()
+    except pa.ArrowInvalid as e:
+        logger.warning(f"Arrow CSV parse failed, falling back to pandas: {e}")
+        return cast_text_columns(parse_sheet_csv_pandas(content, set(columns), metrics), schema)
+    
+    with stage_timer(metrics, 'clean_text'):
+        return cast_text_columns(prepare_sheet_frame(df), schema)
+
+def parse_workbook(content, metrics=None):
+    """Parse a whole-spreadsheet XLSX export into cleaned DataFrames keyed by tab title"""
+    with stage_timer(metrics, 'read_excel'):
+        sheets = pd.read_excel(BytesIO(content), sheet_name=None)
+    with stage_timer(metrics, 'clean_text'):
+        return {str(title).strip(): prepare_sheet_frame(df) for title, df in sheets.items()}
+
+def frame_content_hash(df):
+    """Stable hash of a DataFrame's header and cell values"""
+    digest = hashlib.sha256("\x1f".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()
+
+def get_workbook_url(urls):
+    """Return the XLSX export URL when every sheet URL points at the same spreadsheet, else None"""
+    spreadsheet_ids = {match.group(1) for match in (re.search(r'/spreadsheets/d/([^/]+)/', url) for url in urls) if match}
+    if len(spreadsheet_ids) != 1 or len(urls) == 0:
+        return None
+    return f"https://docs.google.com/spreadsheets/d/{spreadsheet_ids.pop()}/export?format=xlsx"
+
+@st.cache_resource
+def get_http_session():
+    """Shared pooled HTTP session so sheet fetches reuse keep-alive TLS connections"""
+    session = requests.Session()
+    session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    # Retries are scheduled by SheetPoller, so the adapter itself never retries
+    adapter = HTTPAdapter(
+        pool_connections=CONFIG['HTTP_POOL_SIZE'],
+        pool_maxsize=CONFIG['HTTP_POOL_SIZE'],
+        max_retries=0
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+@st.cache_resource
+def get_sheet_revalidation_store():
+    """Process-wide store of HTTP validators, body hashes and parsed frames, keyed by sheet URL"""
+    return {'lock': threading.Lock(), 'entries': {}}
+
+def fetch_with_revalidation(url, store, session, parse, metrics=None):
+    """Download `url` once and parse the body, reusing the previous result when unchanged.
+    
+    Returns `(parsed, content_hash)`. `store` is the revalidation store from
+    get_sheet_revalidation_store() and `session` the pooled client from get_http_session();
+    network time, bytes and revalidation outcomes are recorded in `metrics` when given.
+    Safe to call from background threads: it never touches Streamlit elements or caches.
+    Retries and backoff are the caller's job (see SheetPoller).
+    """
+    headers = {}
+    
+    # Revalidate against the last successful download when the server gave us validators
+    with store['lock']:
+        previous = store['entries'].get(url)
+    if previous:
+        if previous['etag']:
+            headers['If-None-Match'] = previous['etag']
+        if previous['last_modified']:
+            headers['If-Modified-Since'] = previous['last_modified']
+    
+    with stage_timer(metrics, 'network'):
+        response = session.get(
             url, 
-            timeout=CONFIG['REQUEST_TIMEOUT'],
+            timeout=(CONFIG['CONNECT_TIMEOUT'], CONFIG['REQUEST_TIMEOUT']),
             headers=headers
         )
-        response.raise_for_status()
+    if metrics is not None:
+        metrics.inc('dashboard_fetch_bytes_total', len(response.content))
+    
+    if response.status_code == 304 and previous:
+        logger.info(f"Not modified, reusing previously parsed data: {url}")
+        if metrics is not None:
+            metrics.inc('dashboard_fetch_total', result='not_modified')
+        return previous['parsed'], previous['content_hash']
+    
+    response.raise_for_status()
+    
+    # Skip parsing and cleaning entirely when the body is byte-for-byte unchanged
+    content_hash = hashlib.sha256(response.content).hexdigest()
+    if previous and previous['content_hash'] == content_hash:
+        logger.info(f"Content unchanged, reusing previously parsed data: {url}")
+        result = 'unchanged'
+        parsed = previous['parsed']
+    else:
+        result = 'parsed'
+        parsed = parse(response.content)
+    if metrics is not None:
+        metrics.inc('dashboard_fetch_total', result=result)
+    
+    with store['lock']:
+        store['entries'][url] = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_hash': content_hash,
+            'parsed': parsed,
+        }
+    return parsed, content_hash
+
+def load_sheet_data(url, store, session, discipline="", metrics=None):
+    """Load one competition from its Google Sheets CSV export URL, raising on failure.
+    
+    Returns `(df, content_hash)`; see fetch_with_revalidation() for the arguments and
+    parse_sheet_csv() for how `discipline` selects the columns that are loaded. The
+    hash is of the parsed frame, as for load_workbook_data(), so the same data keeps
+    its hash whichever path fetched it.
+    """
+    def parse(content):
+        df = parse_sheet_csv(content, discipline, metrics)
+        return df, frame_content_hash(df)
+    
+    (df, content_hash), _ = fetch_with_revalidation(url, store, session, parse, metrics)
+    logger.info(f"Successfully loaded data with {len(df)} rows and {len(df.columns)} columns")
+    return df, content_hash
+
+def load_workbook_data(url, tabs, store, session, metrics=None):
+    """Load every competition from one XLSX export of the whole spreadsheet, raising on failure.
+    
+    `tabs` maps competition names to workbook tab titles. Returns `{name: (df, content_hash)}`
+    for the competitions whose tab was found; missing tabs are simply left out.
+    """
+    workbook, _ = fetch_with_revalidation(url, store, session, lambda content: parse_workbook(content, metrics), metrics)
+    
+    frames = {}
+    for name, tab in tabs.items():
+        if tab in workbook:
+            # Same columns and text typing as the per-sheet CSV path, so both yield the same frames
+            df = workbook[tab]
+            discipline = competition_discipline(name)
+            columns = sheet_columns(df.columns, discipline)
+            df = cast_text_columns(df[columns].copy(), resolve_sheet_schema(discipline, tuple(columns)))
+            frames[name] = (df, frame_content_hash(df))
+    
+    missing = [tab for tab in tabs.values() if tab not in workbook]
+    if missing:
+        logger.warning(f"Workbook tabs not found, falling back to CSV export: {', '.join(missing)}")
+    logger.info(f"Successfully loaded {len(frames)} competitions from one workbook export")
+    return frames
+
+class CircuitBreaker:
+    """Per-source failure tracker with jittered exponential backoff and a cooldown.
+    
+    After more than CONFIG['MAX_RETRIES'] consecutive failures the breaker opens and the
+    source is left alone for CONFIG['BREAKER_COOLDOWN'] seconds; one trial request is then
+    allowed (half-open) and a success closes it again.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+    
+    def __init__(self):
+        self.failures = 0
+        self.next_attempt_at = 0.0
+        self.last_error = ""
+    
+    @property
+    def state(self):
+        if self.failures <= CONFIG['MAX_RETRIES']:
+            return self.CLOSED
+        if time.monotonic() < self.next_attempt_at:
+            return self.OPEN
+        return self.HALF_OPEN
+    
+    def is_due(self):
+        return time.monotonic() >= self.next_attempt_at
+    
+    def expire(self):
+        # Healthy sources may be refreshed early; failing ones keep to their backoff schedule
+        if self.failures == 0:
+            self.next_attempt_at = 0.0
+    
+    def record_success(self, interval):
+        # An interval of None means the source is not polled again until expired
+        self.failures = 0
+        self.last_error = ""
+        self.next_attempt_at = time.monotonic() + interval if interval is not None else float('inf')
+    
+    def record_failure(self, error_msg):
+        self.failures += 1
+        self.last_error = error_msg
+        if self.failures > CONFIG['MAX_RETRIES']:
+            cooldown = CONFIG['BREAKER_COOLDOWN']
+            self.next_attempt_at = time.monotonic() + random.uniform(cooldown, cooldown * 1.25)
+        else:
+            delay = min(CONFIG['RETRY_BASE_DELAY'] * 2 ** (self.failures - 1), CONFIG['RETRY_MAX_DELAY'])
+            # Jitter keeps sources that failed together from retrying in lockstep
+            self.next_attempt_at = time.monotonic() + random.uniform(delay / 2, delay)
+    
+    def retry_in(self):
+        return max(0.0, self.next_attempt_at - time.monotonic())
+
+@dataclass(frozen=True)
+class SheetSnapshot:
+    """Immutable result of one sheet refresh, shared read-only by every session.
+    
+    `fetched_at` is when `competition` was last loaded successfully (None if it never
+    was); `error` describes the most recent failed refresh, if any.
+    """
+    name: str
+    competition: CompetitionSnapshot
+    fetched_at: datetime = None
+    content_hash: str = ""
+    error: str = ""
+    
+    @property
+    def df(self):
+        """The cleaned sheet the competition snapshot was built from"""
+        return self.competition.df
+    
+    def age_seconds(self):
+        """Seconds since the data was last loaded successfully, or None if it never was"""
+        if self.fetched_at is None:
+            return None
+        return (datetime.now() - self.fetched_at).total_seconds()
+    
+    def is_expired(self):
+        """Whether the data is too old to show without an error"""
+        age = self.age_seconds()
+        return age is None or age > CONFIG['MAX_STALENESS']
+
+class SnapshotStore:
+    """Append-only SQLite history of sheet snapshots, one row per content change.
+    
+    Rows are whole 'key' frames or 'delta' frames of the rows changed since their keyframe.
+    """
+    
+    ROW_COLUMN = '__row__'
+    KEYFRAME_CACHE_SIZE = 16
+    
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._keyframes = {}  # competition -> (keyframe id, frame as written, row hashes)
+        self._decoded = OrderedDict()  # keyframe id -> decoded frame, for seeking
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "id INTEGER PRIMARY KEY, competition TEXT NOT NULL, fetched_at TEXT NOT NULL, "
+                "content_hash TEXT NOT NULL, payload BLOB NOT NULL, "
+                "kind TEXT NOT NULL, base_id INTEGER)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS snapshots_competition ON snapshots (competition, id)")
+            self._latest_hashes = dict(self._conn.execute(
+                "SELECT competition, content_hash FROM snapshots "
+                "WHERE id IN (SELECT MAX(id) FROM snapshots GROUP BY competition)"
+            ).fetchall())
+    
+    @staticmethod
+    def encode(df):
+        """Serialize a frame to an Arrow IPC stream; mixed-type text columns are stored as strings.
         
-        # Read CSV data
-        csv_data = StringIO(response.text)
-        df = pd.read_csv(csv_data)
+        IPC without pandas metadata keeps the fixed overhead far below Parquet's, which
+        matters for one-row deltas.
+        """
+        df = df.assign(**{col: as_text(df[col]) for col in df.columns if df[col].dtype == object})
+        table = pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata(None)
+        buffer = BytesIO()
+        with pa.ipc.new_stream(buffer, table.schema, options=pa.ipc.IpcWriteOptions(compression='zstd')) as writer:
+            writer.write_table(table)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def decode(payload):
+        return pa.ipc.open_stream(payload).read_all().to_pandas()
+    
+    def append(self, competition_name, fetched_at, df, content_hash=None):
+        """Record a snapshot unless it matches the competition's latest one; returns whether it was written"""
+        # Callers that already know frame_content_hash(df) pass it in to skip re-hashing
+        if content_hash is None:
+            content_hash = frame_content_hash(df)
+        if self._latest_hashes.get(competition_name) == content_hash:
+            return False
         
-        # Clean up the dataframe
-        df = df.dropna(how='all')
+        # A delta only refers to its keyframe, so any snapshot decodes from at most two
+        # payloads; a new keyframe starts when the shape changes or most rows differ
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        keyframe = self._keyframes.get(competition_name)
+        changed = None
+        if keyframe is not None:
+            _, key_df, key_hashes = keyframe
+            if list(key_df.columns) == list(df.columns) and len(key_df) == len(df):
+                changed = np.flatnonzero(row_hashes != key_hashes)
+                if len(changed) > len(df) / 2:
+                    changed = None
         
-        # Clean column names - strip whitespace and normalize
-        df.columns = df.columns.str.strip()
+        if changed is None:
+            kind, base_id, payload = 'key', None, self.encode(df)
+        else:
+            kind, base_id = 'delta', keyframe[0]
+            payload = self.encode(df.iloc[changed].assign(**{self.ROW_COLUMN: changed}))
         
-        # Remove unnamed columns more safely
-        if len(df.columns) > 0:
-            unnamed_cols = [col for col in df.columns if str(col).startswith('Unnamed')]
-            df = df.drop(columns=unnamed_cols, errors='ignore')
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO snapshots (competition, fetched_at, content_hash, payload, kind, base_id) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (competition_name, fetched_at.isoformat(), content_hash, payload, kind, base_id)
+            )
+            self._latest_hashes[competition_name] = content_hash
+            if kind == 'key':
+                self._keyframes[competition_name] = (cursor.lastrowid, df, row_hashes)
+        return True
+    
+    def timeline(self, competition_name):
+        """Return `[(snapshot id, fetched_at), ...]` of a competition, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, fetched_at FROM snapshots WHERE competition = ? ORDER BY id", (competition_name,)
+            ).fetchall()
+        return [(snapshot_id, datetime.fromisoformat(fetched_at)) for snapshot_id, fetched_at in rows]
+    
+    def load(self, snapshot_id):
+        """Decode one stored snapshot: returns `(fetched_at, content_hash, df)`"""
+        with self._lock:
+            fetched_at, content_hash, payload, kind, base_id = self._conn.execute(
+                "SELECT fetched_at, content_hash, payload, kind, base_id FROM snapshots WHERE id = ?", (snapshot_id,)
+            ).fetchone()
+        if kind == 'key':
+            df = self.decode(payload)
+        else:
+            base = self._load_keyframe(base_id)
+            delta = self.decode(payload).set_index(self.ROW_COLUMN)
+            df = pd.concat([base.drop(index=delta.index), delta]).sort_index().reset_index(drop=True)
+        return datetime.fromisoformat(fetched_at), content_hash, df
+    
+    def _load_keyframe(self, keyframe_id):
+        with self._lock:
+            df = self._decoded.get(keyframe_id)
+            if df is not None:
+                self._decoded.move_to_end(keyframe_id)
+                return df
+            payload, = self._conn.execute("SELECT payload FROM snapshots WHERE id = ?", (keyframe_id,)).fetchone()
+        df = self.decode(payload)
+        with self._lock:
+            self._decoded[keyframe_id] = df
+            while len(self._decoded) > self.KEYFRAME_CACHE_SIZE:
+                self._decoded.popitem(last=False)
+        return df
+    
+    def latest(self):
+        """Return `{name: (fetched_at, content_hash, df)}` from each competition's newest row"""
+        with self._lock:
+            rows = self._conn.execute("SELECT competition, MAX(id) FROM snapshots GROUP BY competition").fetchall()
+        return {name: self.load(snapshot_id) for name, snapshot_id in rows}
+
+@st.cache_resource
+def get_snapshot_store():
+    """Open the on-disk snapshot history once per process, or None when disabled or unavailable"""
+    if not CONFIG['SNAPSHOT_DB']:
+        return None
+    try:
+        return SnapshotStore(CONFIG['SNAPSHOT_DB'])
+    except sqlite3.Error as e:
+        logger.warning(f"Snapshot history disabled, could not open {CONFIG['SNAPSHOT_DB']}: {e}")
+        return None
+
+class SheetPoller:
+    """Single process-wide background refresher for all competition sheets.
+    
+    Sessions only read the published snapshots, so the number of upstream requests
+    depends on the refresh intervals and never on how many people are watching. Each
+    sheet is rescheduled after a refresh by its competition status: `intervals` maps
+    'live', 'upcoming' and 'completed' to seconds, or None to stop polling.
+    """
+    
+    WORKBOOK_SOURCE = "Workbook export"
+    
+    def __init__(self, sources, intervals, store, session, workbook_url=None, workbook_tabs=None, history=None, metrics=None):
+        self._sources = dict(sources)
+        self._store = store
+        self._session = session
+        self._history = history
+        self._metrics = metrics
+        self._intervals = dict(intervals)
+        self._workbook_url = workbook_url
+        self._workbook_tabs = dict(workbook_tabs or {})
+        self._snapshots = MappingProxyType({})
+        self._breakers = {name: CircuitBreaker() for name in self._sources}
+        self._workbook_breaker = CircuitBreaker()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(len(self._sources), CONFIG['MAX_FETCH_WORKERS']),
+            thread_name_prefix="sheet-fetch"
+        )
+        self._thread = threading.Thread(target=self._run, name="sheet-poller", daemon=True)
+    
+    def start(self):
+        """Publish the last stored snapshots, load whatever is missing, then keep refreshing in the background.
         
-        # Clean text data
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                df[col] = df[col].apply(clean_text)
+        After a restart the first page is served from the snapshot history straight away;
+        those sheets are due immediately, so the background thread revalidates them first.
+        """
+        if self._history is not None:
+            try:
+                stored = self._history.latest()
+            except Exception as e:
+                logger.warning(f"Could not read snapshot history, starting cold: {e}")
+                stored = {}
+            self._snapshots = MappingProxyType({
+                name: SheetSnapshot(
+                    name, build_competition_snapshot(name, df, content_hash, simulate=False), fetched_at, content_hash
+                )
+                for name, (fetched_at, content_hash, df) in stored.items() if name in self._sources
+            })
+            if stored:
+                logger.info(f"Warm start from snapshot history: {len(self._snapshots)} competitions")
+        if len(self._snapshots) < len(self._sources):
+            self.refresh(simulate=False)
+        self._thread.start()
+    
+    def snapshots(self):
+        """Return the latest published snapshots keyed by competition name"""
+        return self._snapshots
+    
+    def breakers(self):
+        """Return the circuit breaker of every competition source keyed by name"""
+        return self._breakers
+    
+    def workbook_breaker(self):
+        """Return the breaker of the whole-workbook source, or None when it is not used"""
+        return self._workbook_breaker if self._workbook_url else None
+    
+    def interval_for(self, status):
+        """Seconds between refreshes of a competition with this status, or None when frozen"""
+        return self._intervals.get(status, self._intervals['upcoming'])
+    
+    def request_refresh(self, names=None):
+        """Ask the background thread to refresh these competitions (default: all) right away.
         
-        logger.info(f"Successfully loaded data with {len(df)} rows and {len(df.columns)} columns")
-        return df
+        Only healthy sources are brought forward; failing ones keep to their backoff schedule.
+        """
+        for name in self._sources if names is None else names:
+            self._breakers[name].expire()
+        self._wake.set()
+    
+    def invalidate(self, names):
+        """Forget the cached downloads of these competitions and refetch them right away"""
+        urls = [self._sources[name] for name in names]
+        if self._workbook_url:
+            urls.append(self._workbook_url)
+        with self._store['lock']:
+            for url in urls:
+                self._store['entries'].pop(url, None)
+        self.request_refresh(names)
+    
+    def refresh(self, simulate=True):
+        """Fetch every due sheet in parallel and publish a new snapshot mapping.
         
-    except requests.RequestException as e:
-        error_msg = f"Network error loading data: {str(e)}"
-        logger.error(error_msg)
+        start() passes `simulate=False` because it runs on the script thread; the
+        background thread then adds the chances via simulate_pending().
+        """
+        due = [name for name, breaker in self._breakers.items() if breaker.is_due()]
+        if not due:
+            return
         
-        if retries < CONFIG['MAX_RETRIES']:
-            logger.info(f"Retrying... attempt {retries + 1}")
-            time.sleep(2 ** retries)
-            return load_sheet_data(url, retries + 1)
+        # One workbook export covers every competition whose tab it contains
+        results = {}
+        if self._workbook_url and self._workbook_breaker.is_due():
+            try:
+                frames = load_workbook_data(
+                    self._workbook_url, self._workbook_tabs, self._store, self._session, self._metrics
+                )
+                if not frames:
+                    # The download worked, so retrying cannot help: the tab mapping is wrong
+                    logger.warning("No competition tabs found in workbook, using per-sheet CSV from now on")
+                    self._workbook_url = None
+                else:
+                    results = {name: frames[name] for name in due if name in frames}
+                    self._workbook_breaker.record_success(0)
+            except Exception as e:
+                self._workbook_breaker.record_failure(str(e))
+                logger.warning(f"Workbook export failed, falling back to per-sheet CSV: {e}")
         
-        st.error(f"🚫 {error_msg}")
-        return pd.DataFrame()
+        # The slowest sheet bounds a refresh, rather than the sum of all of them
+        futures = {
+            name: self._executor.submit(
+                load_sheet_data, self._sources[name], self._store, self._session,
+                competition_discipline(name), self._metrics
+            )
+            for name in due if name not in results
+        }
         
-    except pd.errors.EmptyDataError:
-        st.warning("⚠️ The data source appears to be empty")
-        return pd.DataFrame()
+        snapshots = dict(self._snapshots)
+        for name in due:
+            breaker = self._breakers[name]
+            try:
+                df, content_hash = results[name] if name in results else futures[name].result()
+                # Unchanged content keeps its already-built competition snapshot
+                previous = self._snapshots.get(name)
+                if previous is not None and previous.content_hash == content_hash:
+                    competition = previous.competition
+                else:
+                    with stage_timer(self._metrics, 'build_snapshot', discipline=competition_discipline(name)):
+                        competition = build_competition_snapshot(
+                            name, df, content_hash, previous.competition if previous is not None else None, simulate=False
+                        )
+                if simulate and not competition.simulated and not competition.issues:
+                    with stage_timer(self._metrics, 'simulate', discipline=competition_discipline(name)):
+                        competition = simulate_competition(competition)
+                snapshots[name] = SheetSnapshot(name, competition, datetime.now(), content_hash)
+                self._record_history(snapshots[name])
+                breaker.record_success(self.interval_for(competition.status))
+                continue
+            except requests.RequestException as e:
+                error_msg = f"Network error loading data: {str(e)}"
+            except Exception as e:
+                logger.error(f"Unexpected error loading {name}: {e}")
+                error_msg = f"Unexpected error loading data: {str(e)}"
+            
+            breaker.record_failure(error_msg)
+            if self._metrics is not None:
+                self._metrics.inc('dashboard_fetch_errors_total', source=name)
+            logger.warning(f"{name}: {error_msg} (breaker {breaker.state}, next attempt in {breaker.retry_in():.0f}s)")
+            
+            # Keep serving the last good data; sessions decide when it is too old to trust
+            previous = self._snapshots.get(name)
+            if previous is not None:
+                snapshots[name] = replace(previous, error=error_msg)
+            else:
+                snapshots[name] = SheetSnapshot(name, build_competition_snapshot(name, pd.DataFrame()), error=error_msg)
         
-    except Exception as e:
-        error_msg = f"Unexpected error loading data: {str(e)}"
-        logger.error(error_msg)
-        st.error(f"🚫 {error_msg}")
-        return pd.DataFrame()
+        with self._lock:
+            self._snapshots = MappingProxyType(snapshots)
+    
+    def simulate_pending(self):
+        """Add simulated chances to published snapshots built without them, whether or not they are due"""
+        pending = [
+            name for name, snapshot in self._snapshots.items()
+            if not snapshot.competition.simulated and not snapshot.competition.issues
+        ]
+        if not pending:
+            return
+        snapshots = dict(self._snapshots)
+        for name in pending:
+            with stage_timer(self._metrics, 'simulate', discipline=competition_discipline(name)):
+                competition = simulate_competition(snapshots[name].competition)
+            snapshots[name] = replace(snapshots[name], competition=competition)
+        with self._lock:
+            self._snapshots = MappingProxyType(snapshots)
+    
+    def _record_history(self, snapshot):
+        # History is best-effort: a full disk must not stop live refreshes
+        if self._history is None:
+            return
+        try:
+            # Both fetch paths hash the parsed frame, so the snapshot's hash is the store's
+            self._history.append(snapshot.name, snapshot.fetched_at, snapshot.df, snapshot.content_hash)
+        except Exception as e:
+            logger.warning(f"Could not store snapshot of {snapshot.name}: {e}")
+    
+    def _run(self):
+        while True:
+            try:
+                self.simulate_pending()
+            except Exception as e:
+                logger.error(f"Background simulation failed: {e}")
+            # Sleep until the earliest scheduled attempt (a retry may be due before the interval);
+            # frozen sources have no attempt scheduled until request_refresh() expires them
+            delays = [delay for delay in (breaker.retry_in() for breaker in self._breakers.values()) if delay != float('inf')]
+            self._wake.wait(max(min(delays), 0.5) if delays else None)
+            self._wake.clear()
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Background refresh failed: {e}")
+
+@st.cache_resource
+def get_sheet_poller():
+    """Start the shared sheet poller once per process"""
+    workbook_url = get_workbook_url(list(SHEETS_URLS.values())) if CONFIG['WORKBOOK_FETCH'] else None
+    poller = SheetPoller(
+        SHEETS_URLS, CONFIG['REFRESH_INTERVALS'], get_sheet_revalidation_store(), get_http_session(),
+        workbook_url=workbook_url, workbook_tabs=WORKBOOK_TABS, history=get_snapshot_store(),
+        metrics=get_metrics_registry()
+    )
+    poller.start()
+    return poller
+
+def get_sheet_snapshots(competitions):
+    """Return the published snapshots for the selected competitions without blocking.
+    
+    Stale data is served as-is while a background revalidation is requested.
+    """
+    poller = get_sheet_poller()
+    snapshots = poller.snapshots()
+    breakers = poller.breakers()
+    selected = {name: snapshots[name] for name in competitions}
+    
+    # Failing sources are already on a retry schedule, so only nudge lagging healthy ones;
+    # sources with a None interval are never lagging
+    lagging = []
+    for name, snapshot in selected.items():
+        age = snapshot.age_seconds()
+        interval = poller.interval_for(snapshot.competition.status)
+        if breakers[name].failures == 0 and (age is None or (interval is not None and age > interval * 2)):
+            lagging.append(name)
+    if lagging:
+        poller.request_refresh(lagging)
+    
+    return selected
 
 def get_status_emoji(status_text):
     """Get emoji based on status text"""
@@ -404,94 +1816,295 @@ def get_status_emoji(status_text):
     else:
         return "🔄"
 
-def display_enhanced_metrics(df, competition_name):
-    """Display enhanced metrics with better calculation"""
+def display_enhanced_metrics(snapshot):
+    """Display the headline metrics precomputed in a competition snapshot"""
     col1, col2, col3, col4 = st.columns(4)
+    completed_label = "🧗‍♂️ Completed Problems" if snapshot.schema.discipline == "Boulder" else "✅ Completed"
     
-    # Calculate metrics based on competition type
-    if "Boulder" in competition_name:
-        # Total athletes
-        total_athletes = len(df[df['Athlete Name'].notna() & (df['Athlete Name'] != '')])
-        
-        # Completed problems across all boulders
-        boulder_cols = [col for col in df.columns if 'Boulder' in str(col) and 'Score' in str(col)]
-        completed_problems = 0
-        if boulder_cols:
-            for col in boulder_cols:
-                completed_problems += df[col].notna().sum()
-        
-        # Average score
-        score_col = None
-        for col in df.columns:
-            if 'Total Score' in str(col):
-                score_col = col
-                break
-        
-        avg_score = 0
-        if score_col and score_col in df.columns:
-            numeric_scores = pd.to_numeric(df[score_col], errors='coerce')
-            avg_score = numeric_scores.mean() if not numeric_scores.isna().all() else 0
-        
-        # Leader
-        leader = "TBD"
-        if 'Current Position/Rank' in df.columns:
-            try:
-                leader_mask = pd.to_numeric(df['Current Position/Rank'], errors='coerce') == 1
-                if leader_mask.any():
-                    leader = clean_text(df.loc[leader_mask, 'Athlete Name'].iloc[0])
-            except:
-                pass
-        
-        with col1:
-            st.markdown(f'<div class="metric-card"><h4>👥 Athletes</h4><h2>{total_athletes}</h2></div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown(f'<div class="metric-card"><h4>🧗‍♂️ Completed Problems</h4><h2>{completed_problems}</h2></div>', unsafe_allow_html=True)
-        with col3:
-            st.markdown(f'<div class="metric-card"><h4>📊 Avg Score</h4><h2>{avg_score:.1f}</h2></div>', unsafe_allow_html=True)
-        with col4:
-            st.markdown(f'<div class="metric-card"><h4>🥇 Leader</h4><h2>{leader}</h2></div>', unsafe_allow_html=True)
-            
-    elif "Lead" in competition_name:
-        # Filter active athletes (excluding threshold rows)
-        active_df = df[
-            df['Name'].notna() & 
-            (df['Name'] != '') & 
-            (~df['Name'].astype(str).str.contains('Hold for', na=False)) &
-            (~df['Name'].astype(str).str.contains('Min to', na=False))
-        ]
-        
-        total_athletes = len(active_df)
-        completed = len(active_df[active_df['Manual Score'].notna() & (active_df['Manual Score'] != '')])
-        
-        # Average score
-        if 'Manual Score' in active_df.columns:
-            scores = pd.to_numeric(active_df['Manual Score'], errors='coerce')
-            avg_score = scores.mean() if not scores.isna().all() else 0
+    with col1:
+        st.markdown(f'<div class="metric-card"><h4>👥 Athletes</h4><h2>{snapshot.total_athletes}</h2></div>', unsafe_allow_html=True)
+    with col2:
+        st.markdown(f'<div class="metric-card"><h4>{completed_label}</h4><h2>{snapshot.completed}</h2></div>', unsafe_allow_html=True)
+    with col3:
+        st.markdown(f'<div class="metric-card"><h4>📊 Avg Score</h4><h2>{snapshot.avg_score:.1f}</h2></div>', unsafe_allow_html=True)
+    with col4:
+        st.markdown(f'<div class="metric-card"><h4>🥇 Leader</h4><h2>{snapshot.leader}</h2></div>', unsafe_allow_html=True)
+
+def classify_boulder_standings(df, competition_name, schema, previous_bounds=None):
+    """Sort boulder standings and classify every athlete in one vectorized pass.
+    
+    Returns the named athletes in standings order with extra columns:
+    `completed_boulders`, `worst_possible` and `best_possible` (finish bounds from
+    the scores), `worst_finish` (display text, '' when not shown),
+    `worst_finish_num`, `card_class` and `position_emoji`; plus the FinishBounds,
+    which the next build of the same round updates from `previous_bounds`.
+    """
+    score_col = schema.total_score_col
+    df_sorted = df.copy()
+    
+    # Convert rank to numeric
+    if 'Current Position/Rank' in df.columns:
+        df_sorted['Current Position/Rank'] = pd.to_numeric(df_sorted['Current Position/Rank'], errors='coerce')
+    
+    # Convert score to numeric if available
+    if score_col is not None:
+        df_sorted[score_col] = pd.to_numeric(df_sorted[score_col], errors='coerce')
+    
+    # Sort by position first (ascending), then by score (descending) as tiebreaker
+    try:
+        if 'Current Position/Rank' in df_sorted.columns:
+            df_sorted = df_sorted.sort_values('Current Position/Rank', ascending=True).reset_index(drop=True)
+        elif score_col is not None:
+            df_sorted = df_sorted.sort_values(score_col, ascending=False).reset_index(drop=True)
+    except Exception as e:
+        logger.warning(f"Could not sort data: {e}")
+        df_sorted = df.copy()
+    
+    names = df_sorted['Athlete Name']
+    df_sorted = df_sorted[names.notna() & (names != '')].reset_index(drop=True)
+    
+    # A boulder counts as completed when it has any score other than '-'
+    completed = pd.Series(0, index=df_sorted.index)
+    for _, col_name in schema.boulder_score_cols:
+        scores = df_sorted[col_name]
+        completed += (scores.notna() & ~scores.astype(str).isin(['-', ''])).astype(int)
+    df_sorted['completed_boulders'] = completed
+    
+    # Possible finishes come from the scores themselves rather than sheet formulas;
+    # athletes are keyed by name and occurrence so duplicate names stay distinct
+    bounds = None
+    if schema.boulder_score_cols:
+        boulder_total = sum(pd.to_numeric(df_sorted[col], errors='coerce').fillna(0) for _, col in schema.boulder_score_cols)
+        totals = df_sorted[score_col].fillna(boulder_total) if score_col is not None else boulder_total
+        remaining = len(schema.boulder_score_cols) - completed
+        names = df_sorted['Athlete Name']
+        keys = list(zip(names, names.groupby(names).cumcount()))
+        if previous_bounds is not None:
+            bounds = previous_bounds.updated(keys, totals, remaining)
         else:
-            avg_score = 0
+            bounds = FinishBounds(keys, totals, remaining)
+        worst, best = bounds.for_names(keys)
+        df_sorted['current_total'] = totals
+        df_sorted['worst_possible'] = worst
+        df_sorted['best_possible'] = best
         
-        # Leader
-        leader = "TBD"
-        if 'Current Rank' in active_df.columns:
-            try:
-                leader_idx = pd.to_numeric(active_df['Current Rank'], errors='coerce') == 1
-                if leader_idx.any():
-                    leader = clean_text(active_df.loc[leader_idx, 'Name'].iloc[0])
-            except:
-                pass
+        # Last-boulder strategy: Finals aim for the podium, Semis also for the cut
+        if "Semis" in competition_name or "Final" in competition_name:
+            places = [label for label in STRATEGY_TARGETS if label != 'Qualify' or "Semis" in competition_name]
+            targets = bounds.last_boulder_targets(keys, [STRATEGY_TARGETS[label] for label in places])
+            for label in places:
+                df_sorted[f'strategy {label}'] = [
+                    '' if np.isnan(needed) else boulder_target_text(needed) for needed in targets[STRATEGY_TARGETS[label]]
+                ]
+    else:
+        df_sorted['current_total'] = np.nan
+        df_sorted['worst_possible'] = np.nan
+        df_sorted['best_possible'] = np.nan
+    
+    # Worst possible finish is only shown once all four boulders are done
+    worst_text = pd.Series('', index=df_sorted.index, dtype=object)
+    worst_col = schema.worst_finish_col
+    if CONFIG['NATIVE_FINISH_BOUNDS'] and bounds is not None:
+        worst_text = worst_text.mask(completed == 4, df_sorted['worst_possible'].astype(str))
+    elif worst_col is not None:
+        worst_values = df_sorted[worst_col]
+        text = worst_values.astype(str)
+        shown = (completed == 4) & worst_values.notna() & ~text.isin(['N/A', '', '-'])
+        worst_text = worst_text.mask(shown, text)
+    df_sorted['worst_finish'] = worst_text
+    worst_num = pd.to_numeric(worst_text.str.extract(r'^(\d+)', expand=False), errors='coerce')
+    df_sorted['worst_finish_num'] = worst_num
+    
+    rank = df_sorted['Current Position/Rank'] if 'Current Position/Rank' in df_sorted.columns else pd.Series(np.nan, index=df_sorted.index)
+    rank_num = rank.fillna(0)
+    has_score = df_sorted[score_col].notna() if score_col is not None else pd.Series(False, index=df_sorted.index)
+    colored = (completed == 4) | has_score
+    medal = np.select([rank_num == 1, rank_num == 2], ["🥇", "🥈"], "🥉")
+    
+    # Finals colour by podium (top 3), Semis by qualification (top 8);
+    # green needs the worst possible finish to be inside the cut as well
+    if "Final" in competition_name:
+        in_cut = colored & (rank_num > 0) & (rank_num <= 3)
+        safe = in_cut & (worst_num > 0) & (worst_num <= 3)
+        conditions = [safe, in_cut, colored & (rank_num > 3)]
+        classes = ["podium-position", "podium-contention", "no-podium"]
+        emojis = [medal, "⚠️", "❌"]
+    elif "Semis" in competition_name:
+        in_cut = colored & (rank_num > 0) & (rank_num <= 8)
+        safe = in_cut & (worst_num > 0) & (worst_num <= 8)
+        conditions = [safe, in_cut, colored & (rank_num > 8)]
+        classes = ["qualified", "podium-contention", "eliminated"]
+        emojis = ["✅", "⚠️", "❌"]
+    else:
+        conditions = [colored & (rank_num > 0) & (rank_num <= 3), colored & (rank_num > 0) & (rank_num <= 8), colored & (rank_num > 0)]
+        classes = ["podium-position", "qualified", "eliminated"]
+        emojis = [medal, "✅", "❌"]
+    
+    df_sorted['card_class'] = np.select(conditions, classes, "")
+    
+    # Without a colour, just show the rank number
+    rank_label = np.where(rank_num > 0, "#" + rank.astype(str), "")
+    df_sorted['position_emoji'] = np.select(conditions, emojis, rank_label)
+    return df_sorted, bounds
+
+class RowFragmentCache:
+    """Bounded LRU cache of rendered athlete-card HTML, shared by all sessions.
+    
+    Keys combine the competition type with the row values a card is built from, so
+    only athletes whose row changed since the last refresh are re-rendered.
+    """
+    
+    def __init__(self, maxsize):
+        self._maxsize = maxsize
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_or_render(self, key, render):
+        with self._lock:
+            html = self._fragments.get(key)
+            if html is not None:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return html
+            self.misses += 1
         
-        with col1:
-            st.markdown(f'<div class="metric-card"><h4>👥 Athletes</h4><h2>{total_athletes}</h2></div>', unsafe_allow_html=True)
-        with col2:
-            st.markdown(f'<div class="metric-card"><h4>✅ Completed</h4><h2>{completed}</h2></div>', unsafe_allow_html=True)
-        with col3:
-            st.markdown(f'<div class="metric-card"><h4>📊 Avg Score</h4><h2>{avg_score:.1f}</h2></div>', unsafe_allow_html=True)
-        with col4:
-            st.markdown(f'<div class="metric-card"><h4>🥇 Leader</h4><h2>{leader}</h2></div>', unsafe_allow_html=True)
-
-def display_boulder_results(df, competition_name):
+        html = render()
+        with self._lock:
+            self._fragments[key] = html
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self._maxsize:
+                self._fragments.popitem(last=False)
+        return html
+    
+    def stats(self):
+        """Return size, hits, misses and hit rate for tuning CONFIG['ROW_CACHE_SIZE']"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._fragments),
+                'capacity': self._maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+@st.cache_resource
+def get_row_fragment_cache():
+    """Process-wide cache of rendered athlete cards"""
+    return RowFragmentCache(CONFIG['ROW_CACHE_SIZE'])
+
+@st.cache_resource
+def get_metrics_registry():
+    """Process-wide hot-path metrics, exported on CONFIG['METRICS_PORT'] when set"""
+    metrics = MetricsRegistry()
+    fragment_cache = get_row_fragment_cache()
+    metrics.add_collector(lambda: [
+        ('dashboard_row_cache_hits_total', {}, fragment_cache.hits),
+        ('dashboard_row_cache_misses_total', {}, fragment_cache.misses),
+    ])
+    if CONFIG['METRICS_PORT']:
+        try:
+            serve_metrics(metrics, CONFIG['METRICS_PORT'])
+        except OSError as e:
+            logger.warning(f"Metrics endpoint disabled, could not bind port {CONFIG['METRICS_PORT']}: {e}")
+    return metrics
+
+def competition_type(competition_name):
+    """Discipline and round of a competition, e.g. 'Boulder Final'; cards do not depend on gender"""
+    round_name = "Final" if "Final" in competition_name else "Semis" if "Semis" in competition_name else ""
+    return f"{competition_discipline(competition_name)} {round_name}".strip()
+
+def row_fragment_key(kind, row, columns, extra=()):
+    """Cache key for one athlete card: its competition type plus the values it is built from"""
+    # repr() keeps the key hashable and makes missing values (NaN) compare equal
+    return (kind, tuple(repr(row.get(col)) for col in columns), extra)
+
+def render_standings(rows_html):
+    """Send a competition's athlete cards to the browser as one markdown element.
+    
+    One element per competition instead of one per athlete keeps the number of
+    delta messages per rerun independent of the field size.
+    """
+    if rows_html:
+        st.markdown("\n".join(rows_html), unsafe_allow_html=True)
+
+def format_boulder_row(row, schema, competition_name):
+    """Build the HTML card for one classified boulder athlete"""
+    score_col = schema.total_score_col
+    athlete = str(row.get('Athlete Name', 'Unknown'))
+    total_score = row.get(score_col, 'N/A') if score_col else 'N/A'
+    completed_boulders = row['completed_boulders']
+    card_class = row['card_class']
+    position_emoji = row['position_emoji']
+    
+    # Boulder scores
+    boulder_scores = []
+    for i, col_name in schema.boulder_score_cols:
+        score = row.get(col_name, '-')
+        if pd.notna(score) and str(score) != '-' and str(score) != '':
+            boulder_scores.append(f"B{i}: {score}")
+        else:
+            boulder_scores.append(f"B{i}: -")
+    
+    boulder_display = " | ".join(boulder_scores) if boulder_scores else "No boulder data available"
+    
+    worst_finish_display = f" | Worst Finish: {row['worst_finish']}" if row['worst_finish'] else ""
+    
+    # Finish range for athletes part-way through the round
+    range_display = ""
+    if 0 < completed_boulders < 4 and pd.notna(row['best_possible']):
+        range_display = f" | Possible finish: {int(row['best_possible'])}–{int(row['worst_possible'])}"
+    
+    # Strategy display for boulder competitions after 3 boulders completed
+    strategy_display = ""
+    if ("Semis" in competition_name or "Final" in competition_name) and completed_boulders == 3:
+        if CONFIG['NATIVE_BOULDER_STRATEGY'] and 'strategy 1st' in row:
+            strategy_cols = [(label, f'strategy {label}') for label in STRATEGY_TARGETS if f'strategy {label}' in row]
+        else:
+            strategy_cols = schema.strategy_cols
+        if strategy_cols:
+            strategies = []
+            for place, col in strategy_cols:
+                strategy_value = row.get(col, '')
+                if strategy_value and str(strategy_value) not in ['', 'nan', 'N/A']:
+                    strategy_clean = str(strategy_value)
+                    if strategy_clean:
+                        if place == '1st':
+                            strategies.append(f"🥇 1st: {strategy_clean}")
+                        elif place == '2nd':
+                            strategies.append(f"🥈 2nd: {strategy_clean}")
+                        elif place == '3rd':
+                            strategies.append(f"🥉 3rd: {strategy_clean}")
+                        elif place == 'Qualify':
+                            strategies.append(f"✅ Qualify: {strategy_clean}")
+    
+            if strategies:
+                comp_type = "Final" if "Final" in competition_name else "Semi"
+                strategy_display = f"<br><div class='targets'><strong>{comp_type} Boulder Strategy:</strong> {' | '.join(strategies)}</div>"
+    
+    chance_display = f" | {row['cut_chance']}" if row.get('cut_chance') else ""
+    
+    # Create the display text
+    if completed_boulders == 4:
+        detail_text = f"Total: {total_score} | {boulder_display}{worst_finish_display}{chance_display}"
+    elif completed_boulders == 3 and ("Semis" in competition_name or "Final" in competition_name):
+        detail_text = f"Total: {total_score} | {boulder_display} | 1 boulder remaining{range_display}{chance_display}"
+    else:
+        detail_text = f"Total: {total_score} | {boulder_display} | Progress: {completed_boulders}/4 boulders{range_display}{chance_display}"
+    
+    return (
+        f'<div class="athlete-row {card_class}">'
+        f'<strong>{position_emoji} - {athlete}</strong><br>'
+        f'<small>{detail_text}</small>{strategy_display}'
+        '</div>'
+    )
+
+def display_boulder_results(snapshot):
     """Display boulder competition results with enhanced formatting"""
-    status, status_emoji = get_competition_status(df, competition_name)
+    competition_name, df = snapshot.name, snapshot.df
+    status, status_emoji = snapshot.status, snapshot.status_emoji
     status_class = f"badge-{status}"
     
     st.markdown(f"""
@@ -503,209 +2116,122 @@ def display_boulder_results(df, competition_name):
         st.markdown('<div class="error-card">⚠️ No data available for this competition</div>', unsafe_allow_html=True)
         return
     
-    # Validate required columns
-    required_cols = ['Athlete Name', 'Current Position/Rank']
-    is_valid, issues = validate_dataframe(df, required_cols)
-    
-    if not is_valid:
-        st.markdown(f'<div class="error-card">❌ Data validation failed: {"; ".join(issues)}</div>', unsafe_allow_html=True)
+    # Required columns were validated at ingest
+    if snapshot.issues:
+        st.markdown(f'<div class="error-card">❌ Data validation failed: {"; ".join(snapshot.issues)}</div>', unsafe_allow_html=True)
         with st.expander("🔍 Raw Data"):
             st.dataframe(df, use_container_width=True, hide_index=True)
         return
     
     # Display enhanced metrics
-    display_enhanced_metrics(df, competition_name)
+    display_enhanced_metrics(snapshot)
     
     st.markdown("#### 📋 Current Standings")
     
-    # Find the total score column
-    score_col = None
-    for col in df.columns:
-        if 'Total Score' in str(col):
-            score_col = col
-            break
+    schema = snapshot.schema
+    
+    # All athlete cards go to the browser as a single element
+    fragment_cache = get_row_fragment_cache()
+    kind = competition_type(competition_name)
+    card_columns = (
+        ['Athlete Name', schema.total_score_col, 'completed_boulders', 'worst_finish', 'best_possible', 'worst_possible',
+         'cut_chance', 'card_class', 'position_emoji']
+        + [col for _, col in schema.boulder_score_cols]
+        + [col for _, col in schema.strategy_cols]
+        + [f'strategy {label}' for label in STRATEGY_TARGETS if f'strategy {label}' in snapshot.standings.columns]
+    )
+    render_standings([
+        fragment_cache.get_or_render(
+            row_fragment_key(kind, row, card_columns, schema.boulder_score_cols + schema.strategy_cols),
+            lambda: format_boulder_row(row, schema, competition_name)
+        )
+        for row in snapshot.standings.to_dict('records')
+    ])
+
+def format_lead_row(row, qualification_info):
+    """Build the HTML card for one lead athlete"""
+    name = str(row.get('Name', 'Unknown'))
+    score = row.get('Manual Score', 'N/A')
+    rank = row.get('Current Rank', 'N/A')
+    status = str(row.get('Status', 'Unknown'))
+    worst_finish = row.get('Worst Finish', 'N/A')
+    
+    # Determine if athlete has a score or is awaiting result
+    has_score = score not in ['N/A', '', None] and not pd.isna(score)
+    
+    # If no score yet and we have qualification info, show thresholds
+    threshold_display = ""
+    if not has_score and qualification_info:
+        thresholds = []
+        if 'Hold for 1st' in qualification_info:
+            thresholds.append(f'🥇 1st: {qualification_info["Hold for 1st"]}')
+        if 'Hold for 2nd' in qualification_info:
+            thresholds.append(f'🥈 2nd: {qualification_info["Hold for 2nd"]}')
+        if 'Hold for 3rd' in qualification_info:
+            thresholds.append(f'🥉 3rd: {qualification_info["Hold for 3rd"]}')
+        if 'Hold to Podium' in qualification_info:
+            thresholds.append(f'🏆 Podium: {qualification_info["Hold to Podium"]}')
+        if 'Min to Podium' in qualification_info:
+            thresholds.append(f'⚠️ Min: {qualification_info["Min to Podium"]}')
+    
+        if thresholds:
+            threshold_display = f"<br><div class='targets'><strong>Targets:</strong> {' | '.join(thresholds)}</div>"
+    
+    # Get status styling
+    status_emoji = get_status_emoji(status)
+    
+    # Determine card class based on status and score availability - only color if has score
+    card_class = ""
+    position_emoji = ""
+    
+    if has_score:
+        if "Qualified" in status or "✓✓" in status:
+            card_class = "qualified"
+            status_emoji = "✅"
+        elif "Eliminated" in status or "✗" in status:
+            card_class = "eliminated"
+            status_emoji = "❌"
+        elif "Podium" in status and "No Podium" not in status and "Contention" not in status:
+            card_class = "podium-position"
+            status_emoji = "🏆"
+        elif "Podium Contention" in status or "Contention" in status:
+            card_class = "podium-contention"
+            status_emoji = "⚠️"
+        elif "No Podium" in status:
+            card_class = "no-podium"
+            status_emoji = "❌"
+    
+    # Set position emoji
+    rank_num = safe_numeric_conversion(rank)
+    if rank_num > 0:
+        if has_score and card_class:
+            position_emoji = status_emoji
+        else:
+            position_emoji = f"#{rank_num}"
     
-    # Sort and prepare data
-    df_sorted = df.copy()
+    # Show score if available, otherwise show "Awaiting Result"
+    score_display = score if has_score else "Awaiting Result"
     
-    # Convert rank to numeric
-    if 'Current Position/Rank' in df.columns:
-        df_sorted['Current Position/Rank'] = pd.to_numeric(df_sorted['Current Position/Rank'], errors='coerce')
+    # Add worst finish info if athlete has a score
+    worst_finish_display = ""
+    if has_score and worst_finish not in ['N/A', '', None] and not pd.isna(worst_finish):
+        worst_finish_clean = str(worst_finish)
+        if worst_finish_clean and worst_finish_clean != '-':
+            worst_finish_display = f" | Worst Finish: {worst_finish_clean}"
     
-    # Convert score to numeric if available
-    if score_col is not None:
-        df_sorted[score_col] = pd.to_numeric(df_sorted[score_col], errors='coerce')
+    chance_display = f" | {row['cut_chance']}" if row.get('cut_chance') else ""
     
-    # Sort by position first (ascending), then by score (descending) as tiebreaker
-    try:
-        if 'Current Position/Rank' in df_sorted.columns:
-            df_sorted = df_sorted.sort_values('Current Position/Rank', ascending=True).reset_index(drop=True)
-        elif score_col is not None:
-            df_sorted = df_sorted.sort_values(score_col, ascending=False).reset_index(drop=True)
-    except Exception as e:
-        logger.warning(f"Could not sort data: {e}")
-        df_sorted = df.copy()
-    
-    # Display results with enhanced styling
-    for idx, row in df_sorted.iterrows():
-        if pd.isna(row.get('Athlete Name')) or row.get('Athlete Name') == '':
-            continue
-            
-        rank = row.get('Current Position/Rank', 'N/A')
-        athlete = clean_text(str(row.get('Athlete Name', 'Unknown')))
-        total_score = row.get(score_col, 'N/A') if score_col else 'N/A'
-        
-        # Boulder scores and completion check
-        boulder_scores = []
-        completed_boulders = 0
-        for i in range(1, 5):
-            col_name = f'Boulder {i} Score (0-25)'
-            if col_name in df.columns:
-                score = row.get(col_name, '-')
-                if pd.notna(score) and str(score) != '-' and str(score) != '':
-                    boulder_scores.append(f"B{i}: {score}")
-                    completed_boulders += 1
-                else:
-                    boulder_scores.append(f"B{i}: -")
-        
-        boulder_display = " | ".join(boulder_scores) if boulder_scores else "No boulder data available"
-        
-        # Check for worst finish information
-        worst_finish_display = ""
-        if completed_boulders == 4:
-            worst_finish_col = None
-            
-            if "Boulder" in competition_name and 'Worst Possible Finish' in df.columns:
-                worst_finish_col = 'Worst Possible Finish'
-            elif "Lead" in competition_name and 'Worst Finish' in df.columns:
-                worst_finish_col = 'Worst Finish'
-            else:
-                # Try other variations as fallback
-                for col in df.columns:
-                    col_str = str(col).strip().lower()
-                    if ('worst' in col_str and 'possible' in col_str and 'finish' in col_str) or ('worst' in col_str and 'finish' in col_str):
-                        worst_finish_col = col
-                        break
-            
-            if worst_finish_col and worst_finish_col in df.columns:
-                worst_finish = row.get(worst_finish_col, 'N/A')
-                if worst_finish not in ['N/A', '', None] and not pd.isna(worst_finish):
-                    worst_finish_clean = clean_text(str(worst_finish))
-                    if worst_finish_clean and worst_finish_clean != '-':
-                        worst_finish_display = f" | Worst Finish: {worst_finish_clean}"
-
-        # Color coding based on completion and competition type
-        position_emoji = ""
-        card_class = ""
-        
-        try:
-            rank_num = safe_numeric_conversion(rank)
-            
-            # Get worst possible finish number
-            worst_finish_num = None
-            if worst_finish_display:
-                worst_finish_match = re.search(r'Worst Finish: (\d+)', worst_finish_display)
-                if worst_finish_match:
-                    worst_finish_num = int(worst_finish_match.group(1))
-            
-            # Only apply coloring if athlete has completed all 4 boulders OR has a valid score
-            if completed_boulders == 4 or (total_score not in ['N/A', '', None] and not pd.isna(total_score)):
-                if "Final" in competition_name:
-                    # For Finals, use podium-based coloring (top 3)
-                    if rank_num > 0 and rank_num <= 3:
-                        if worst_finish_num and worst_finish_num <= 3:
-                            card_class = "podium-position"  # Green - safe podium
-                            position_emoji = "🥇" if rank_num == 1 else "🥈" if rank_num == 2 else "🥉"
-                        else:
-                            card_class = "podium-contention"  # Yellow - could drop off podium
-                            position_emoji = "⚠️"
-                    elif rank_num > 3:
-                        card_class = "no-podium"  # Red - out of podium positions
-                        position_emoji = "❌"
-                        
-                elif "Semis" in competition_name:
-                    # For Semis, use qualification-based coloring (top 8)
-                    if rank_num > 0 and rank_num <= 8:
-                        if worst_finish_num and worst_finish_num <= 8:
-                            card_class = "qualified"  # Green - safe qualification
-                            position_emoji = "✅"
-                        else:
-                            card_class = "podium-contention"  # Yellow - could drop out of top 8
-                            position_emoji = "⚠️"
-                    elif rank_num > 8:
-                        card_class = "eliminated"  # Red - out of qualifying positions
-                        position_emoji = "❌"
-                
-                else:
-                    # For other competitions, use standard rank-based coloring
-                    if rank_num > 0 and rank_num <= 3:
-                        card_class = "podium-position"
-                        position_emoji = "🥇" if rank_num == 1 else "🥈" if rank_num == 2 else "🥉"
-                    elif rank_num > 0 and rank_num <= 8:
-                        card_class = "qualified"
-                        position_emoji = "✅"
-                    elif rank_num > 0:
-                        card_class = "eliminated"
-                        position_emoji = "❌"
-            
-            # If no complete score, just show rank number without special coloring
-            if not position_emoji and rank_num > 0:
-                position_emoji = f"#{rank_num}"
-                        
-        except Exception as e:
-            logger.warning(f"Error determining card class: {e}")
-            if rank_num > 0:
-                position_emoji = f"#{rank_num}"
-        
-        # Strategy display for boulder competitions after 3 boulders completed
-        strategy_display = ""
-        if ("Semis" in competition_name or "Final" in competition_name) and completed_boulders == 3:
-            strategy_cols = {}
-            for col in df.columns:
-                col_str = str(col)
-                if '1st Place Strategy' in col_str or '1st Place Strate' in col_str:
-                    strategy_cols['1st'] = col
-                elif '2nd Place Strategy' in col_str or '2nd Place Strate' in col_str:
-                    strategy_cols['2nd'] = col
-                elif '3rd Place Strategy' in col_str or '3rd Place Strate' in col_str:
-                    strategy_cols['3rd'] = col
-            
-            if strategy_cols:
-                strategies = []
-                for place, col in strategy_cols.items():
-                    strategy_value = row.get(col, '')
-                    if strategy_value and str(strategy_value) not in ['', 'nan', 'N/A']:
-                        strategy_clean = clean_text(str(strategy_value))
-                        if strategy_clean:
-                            if place == '1st':
-                                strategies.append(f"🥇 1st: {strategy_clean}")
-                            elif place == '2nd':
-                                strategies.append(f"🥈 2nd: {strategy_clean}")
-                            elif place == '3rd':
-                                strategies.append(f"🥉 3rd: {strategy_clean}")
-                
-                if strategies:
-                    comp_type = "Final" if "Final" in competition_name else "Semi"
-                    strategy_display = f"<br><div class='targets'><strong>{comp_type} Boulder Strategy:</strong> {' | '.join(strategies)}</div>"
-        
-        # Create the display text
-        if completed_boulders == 4:
-            detail_text = f"Total: {total_score} | {boulder_display}{worst_finish_display}"
-        elif completed_boulders == 3 and ("Semis" in competition_name or "Final" in competition_name):
-            detail_text = f"Total: {total_score} | {boulder_display} | 1 boulder remaining"
-        else:
-            detail_text = f"Total: {total_score} | {boulder_display} | Progress: {completed_boulders}/4 boulders"
-        
-        st.markdown(f"""
-        <div class="athlete-row {card_class}">
-            <strong>{position_emoji} - {athlete}</strong><br>
-            <small>{detail_text}</small>{strategy_display}
-        </div>
-        """, unsafe_allow_html=True)
+    return (
+        f'<div class="athlete-row {card_class}">'
+        f'<strong>{position_emoji} #{rank} - {name}</strong><br>'
+        f'<small>Score: {score_display} | Status: {status}{worst_finish_display}{chance_display}</small>{threshold_display}'
+        '</div>'
+    )
 
-def display_lead_results(df, competition_name):
+def display_lead_results(snapshot):
     """Display lead competition results with enhanced formatting"""
-    status, status_emoji = get_competition_status(df, competition_name)
+    competition_name, df = snapshot.name, snapshot.df
+    status, status_emoji = snapshot.status, snapshot.status_emoji
     status_class = f"badge-{status}"
     
     st.markdown(f"""
@@ -717,42 +2243,18 @@ def display_lead_results(df, competition_name):
         st.markdown('<div class="error-card">⚠️ No data available for this competition</div>', unsafe_allow_html=True)
         return
     
-    # Validate Name column exists
-    if 'Name' not in df.columns:
-        st.markdown('<div class="error-card">❌ Name column not found in data</div>', unsafe_allow_html=True)
+    # Name column was validated at ingest
+    if snapshot.issues:
+        st.markdown(f'<div class="error-card">❌ {"; ".join(snapshot.issues)}</div>', unsafe_allow_html=True)
         with st.expander("🔍 Raw Data"):
             st.dataframe(df, use_container_width=True, hide_index=True)
         return
     
-    # Extract qualification thresholds from the bottom rows
-    qualification_info = {}
-    try:
-        for idx, row in df.iterrows():
-            if pd.isna(row.get('Name')) or row.get('Name') == '':
-                continue
-            # Check if this row contains qualification thresholds
-            threshold_cols = ['Hold for 1st', 'Hold for 2nd', 'Hold for 3rd', 'Hold to Qualify', 'Min to Qualify']
-            for col in threshold_cols:
-                if col in df.columns and pd.notna(row.get(col)):
-                    qualification_info[col] = clean_text(str(row.get(col)))
-    except Exception as e:
-        logger.warning(f"Error extracting qualification thresholds: {e}")
-    
-    # Filter out empty rows and scoring reference rows safely
-    try:
-        active_df = df[
-            df['Name'].notna() & 
-            (df['Name'] != '') & 
-            (~df['Name'].astype(str).str.isdigit()) &
-            (~df['Name'].astype(str).str.contains('Hold for', na=False)) &
-            (~df['Name'].astype(str).str.contains('Min to', na=False))
-        ]
-    except Exception as e:
-        logger.error(f"Error filtering data: {e}")
-        active_df = df[df['Name'].notna() & (df['Name'] != '')]
+    # Qualification thresholds were computed from the posted scores (or read from the bottom rows) at ingest
+    qualification_info = dict(snapshot.thresholds)
     
     # Display enhanced metrics
-    display_enhanced_metrics(active_df, competition_name)
+    display_enhanced_metrics(snapshot)
     
     st.markdown("#### 📋 Current Standings")
     
@@ -780,91 +2282,18 @@ def display_lead_results(df, competition_name):
             </div>
             """, unsafe_allow_html=True)
     
-    # Sort by Current Rank if available
-    try:
-        if 'Current Rank' in active_df.columns:
-            active_df['Current Rank'] = pd.to_numeric(active_df['Current Rank'], errors='coerce')
-            active_df = active_df.sort_values('Current Rank', ascending=True).reset_index(drop=True)
-    except Exception as e:
-        logger.warning(f"Could not sort by rank: {e}")
-    
-    # Display results with enhanced formatting
-    for idx, row in active_df.iterrows():
-        name = clean_text(str(row.get('Name', 'Unknown')))
-        score = row.get('Manual Score', 'N/A')
-        rank = row.get('Current Rank', 'N/A')
-        status = clean_text(str(row.get('Status', 'Unknown')))
-        worst_finish = row.get('Worst Finish', 'N/A')
-        
-        # Determine if athlete has a score or is awaiting result
-        has_score = score not in ['N/A', '', None] and not pd.isna(score)
-        
-        # If no score yet and we have qualification info, show thresholds
-        threshold_display = ""
-        if not has_score and qualification_info:
-            thresholds = []
-            if 'Hold for 1st' in qualification_info:
-                thresholds.append(f'🥇 1st: {qualification_info["Hold for 1st"]}')
-            if 'Hold for 2nd' in qualification_info:
-                thresholds.append(f'🥈 2nd: {qualification_info["Hold for 2nd"]}')
-            if 'Hold for 3rd' in qualification_info:
-                thresholds.append(f'🥉 3rd: {qualification_info["Hold for 3rd"]}')
-            if 'Hold to Podium' in qualification_info:
-                thresholds.append(f'🏆 Podium: {qualification_info["Hold to Podium"]}')
-            if 'Min to Podium' in qualification_info:
-                thresholds.append(f'⚠️ Min: {qualification_info["Min to Podium"]}')
-            
-            if thresholds:
-                threshold_display = f"<br><div class='targets'><strong>Targets:</strong> {' | '.join(thresholds)}</div>"
-        
-        # Get status styling
-        status_emoji = get_status_emoji(status)
-        
-        # Determine card class based on status and score availability - only color if has score
-        card_class = ""
-        position_emoji = ""
-        
-        if has_score:
-            if "Qualified" in status or "✓✓" in status:
-                card_class = "qualified"
-                status_emoji = "✅"
-            elif "Eliminated" in status or "✗" in status:
-                card_class = "eliminated"
-                status_emoji = "❌"
-            elif "Podium" in status and "No Podium" not in status and "Contention" not in status:
-                card_class = "podium-position"
-                status_emoji = "🏆"
-            elif "Podium Contention" in status or "Contention" in status:
-                card_class = "podium-contention"
-                status_emoji = "⚠️"
-            elif "No Podium" in status:
-                card_class = "no-podium"
-                status_emoji = "❌"
-        
-        # Set position emoji
-        rank_num = safe_numeric_conversion(rank)
-        if rank_num > 0:
-            if has_score and card_class:
-                position_emoji = status_emoji
-            else:
-                position_emoji = f"#{rank_num}"
-        
-        # Show score if available, otherwise show "Awaiting Result"
-        score_display = score if has_score else "Awaiting Result"
-        
-        # Add worst finish info if athlete has a score
-        worst_finish_display = ""
-        if has_score and worst_finish not in ['N/A', '', None] and not pd.isna(worst_finish):
-            worst_finish_clean = clean_text(str(worst_finish))
-            if worst_finish_clean and worst_finish_clean != '-':
-                worst_finish_display = f" | Worst Finish: {worst_finish_clean}"
-        
-        st.markdown(f"""
-        <div class="athlete-row {card_class}">
-            <strong>{position_emoji} #{rank} - {name}</strong><br>
-            <small>Score: {score_display} | Status: {status}{worst_finish_display}</small>{threshold_display}
-        </div>
-        """, unsafe_allow_html=True)
+    # All athlete cards go to the browser as a single element
+    fragment_cache = get_row_fragment_cache()
+    kind = competition_type(competition_name)
+    card_columns = ('Name', 'Manual Score', 'Current Rank', 'Status', 'Worst Finish', 'cut_chance')
+    thresholds_key = snapshot.thresholds
+    render_standings([
+        fragment_cache.get_or_render(
+            row_fragment_key(kind, row, card_columns, thresholds_key),
+            lambda: format_lead_row(row, qualification_info)
+        )
+        for row in snapshot.standings.to_dict('records')
+    ])
 
 def get_filtered_competitions(competition_type, gender_filter, round_filter):
     """Get filtered competitions based on user selection"""
@@ -890,6 +2319,143 @@ def get_filtered_competitions(competition_type, gender_filter, round_filter):
     
     return filtered_competitions
 
+def display_source_health():
+    """Show the circuit breaker state of every data source in the sidebar"""
+    poller = get_sheet_poller()
+    breakers = dict(poller.breakers())
+    if poller.workbook_breaker() is not None:
+        breakers[SheetPoller.WORKBOOK_SOURCE] = poller.workbook_breaker()
+    unhealthy = [name for name, breaker in breakers.items() if breaker.failures > 0]
+    
+    with st.sidebar.expander(f"🩺 Data Sources ({len(breakers) - len(unhealthy)}/{len(breakers)} healthy)", expanded=bool(unhealthy)):
+        for name, breaker in breakers.items():
+            state = breaker.state
+            if breaker.failures == 0:
+                st.caption(f"🟢 {name}")
+            elif state == CircuitBreaker.OPEN:
+                st.caption(f"🔴 {name}: circuit open, retry in {breaker.retry_in():.0f}s")
+            elif state == CircuitBreaker.HALF_OPEN:
+                st.caption(f"🟠 {name}: circuit half-open, trial request pending")
+            else:
+                st.caption(f"🟡 {name}: {breaker.failures} failure(s), retry in {breaker.retry_in():.0f}s")
+
+def display_render_cache_stats():
+    """Show athlete-card cache hit rates in the sidebar"""
+    stats = get_row_fragment_cache().stats()
+    with st.sidebar.expander(f"⚡ Card Cache ({stats['hit_rate']:.0%} hits)"):
+        st.caption(f"Entries: {stats['size']}/{stats['capacity']}")
+        st.caption(f"Hits: {stats['hits']} | Misses: {stats['misses']}")
+
+def display_debug_panel():
+    """Show hot-path stage timings and counters in the sidebar (opt-in, see CONFIG['DEBUG_PANEL'])"""
+    if not (CONFIG['DEBUG_PANEL'] or st.query_params.get("debug") == "1"):
+        return
+    
+    metrics = get_metrics_registry()
+    with st.sidebar.expander("🐞 Performance", expanded=True):
+        stages = pd.DataFrame([
+            {
+                'Stage': labels.pop('stage', name) + "".join(f" ({value})" for value in labels.values()),
+                'Count': count,
+                'Mean ms': mean * 1000,
+                'p50 ms': p50 * 1000,
+                'p95 ms': p95 * 1000,
+            }
+            for name, labels, count, mean, p50, p95 in metrics.histogram_summary()
+        ])
+        if stages.empty:
+            st.caption("No timings recorded yet")
+        else:
+            st.dataframe(stages.round(2), use_container_width=True, hide_index=True)
+        for name, labels, value in metrics.counters():
+            label_text = ", ".join(f"{key}={label}" for key, label in labels.items())
+            st.caption(f"{name}{f' ({label_text})' if label_text else ''}: {value:,}")
+
+def display_competition(snapshot):
+    """Display one competition's standings from its published snapshot"""
+    comp_name = snapshot.name
+    competition = snapshot.competition
+    
+    if snapshot.fetched_at is not None:
+        st.caption(f"📡 Last updated: {snapshot.fetched_at.strftime('%H:%M:%S')}")
+    
+    # Brief upstream failures keep showing the last good standings
+    if snapshot.error and snapshot.is_expired():
+        st.error(f"🚫 {snapshot.error}")
+    elif snapshot.error:
+        st.caption(f"⏳ Latest refresh failed, showing data from {int(snapshot.age_seconds())}s ago")
+    
+    metrics = get_metrics_registry()
+    discipline = competition.schema.discipline or "Other"
+    with stage_timer(metrics, 'render', discipline=discipline):
+        if "Boulder" in comp_name:
+            display_boulder_results(competition)
+        elif "Lead" in comp_name:
+            display_lead_results(competition)
+        else:
+            if not competition.df.empty:
+                st.dataframe(competition.df, use_container_width=True, hide_index=True)
+            else:
+                st.markdown('<div class="error-card">❌ No data available</div>', unsafe_allow_html=True)
+    if competition.standings is not None:
+        metrics.inc('dashboard_rows_rendered_total', len(competition.standings), discipline=discipline)
+
+def display_live_competition(competition_name, auto_refresh):
+    """Display one competition in a fragment that redraws itself at the sheet's poll interval.
+    
+    Timed reruns read the latest published snapshot and redraw only this block, never
+    the rest of the page. A status change (e.g. live to completed) triggers one full
+    rerun, which reschedules the block and updates the overview counts.
+    """
+    status = get_sheet_snapshots([competition_name])[competition_name].competition.status
+    run_every = get_sheet_poller().interval_for(status) if auto_refresh else None
+    
+    @st.fragment(run_every=run_every)
+    def competition_block():
+        snapshot = get_sheet_snapshots([competition_name])[competition_name]
+        if snapshot.competition.status != status:
+            st.rerun()
+        st.session_state.last_refresh = datetime.now()
+        display_competition(snapshot)
+    
+    competition_block()
+
+def get_replay_snapshot(competition_name):
+    """Show the sidebar replay controls; return the recorded snapshot to display, or None for live data.
+    
+    The slider seeks by position in the competition's timeline, and each position
+    decodes from at most a keyframe and one delta of the snapshot history.
+    """
+    history = get_snapshot_store()
+    if history is None:
+        return None
+    
+    st.sidebar.markdown("### ⏪ Replay")
+    if not st.sidebar.toggle("Replay recorded snapshots", key="replay_enabled",
+                             help="Scrub through how the selected competition evolved"):
+        return None
+    
+    timeline = history.timeline(competition_name)
+    if not timeline:
+        st.sidebar.caption(f"No snapshots recorded for {competition_name} yet")
+        return None
+    
+    position = len(timeline) - 1
+    if len(timeline) > 1:
+        position = st.sidebar.select_slider(
+            f"🕐 {competition_name}",
+            options=range(len(timeline)),
+            value=len(timeline) - 1,
+            format_func=lambda i: timeline[i][1].strftime('%d %b %H:%M:%S'),
+            key=f"replay_position_{competition_name}"
+        )
+    st.sidebar.caption(f"Snapshot {position + 1} of {len(timeline)}")
+    
+    fetched_at, content_hash, df = history.load(timeline[position][0])
+    # Built on the script thread for every slider position, so without the simulation
+    competition = build_competition_snapshot(competition_name, df, content_hash, simulate=False)
+    return SheetSnapshot(competition_name, competition, fetched_at, content_hash)
+
 def main():
     """Main application function with enhanced features"""
     
@@ -915,29 +2481,29 @@ def main():
     auto_refresh = st.sidebar.checkbox(
         "Enable Auto-Refresh", 
         value=st.session_state.auto_refresh_enabled,
-        help=f"Automatically refresh data every {CONFIG['AUTO_REFRESH_INTERVAL']} seconds"
+        help="Redraw the selected competition at its refresh interval: "
+             + ", ".join(f"{status} every {interval}s" if interval else f"{status} on demand"
+                         for status, interval in CONFIG['REFRESH_INTERVALS'].items())
     )
     st.session_state.auto_refresh_enabled = auto_refresh
     
     # Manual refresh with enhanced feedback
     refresh_col1, refresh_col2 = st.sidebar.columns(2)
     with refresh_col1:
-        if st.button("🔄 Refresh Now", type="primary"):
-            st.cache_data.clear()
-            st.session_state.last_refresh = datetime.now()
-            st.sidebar.success("✅ Data refreshed!")
-            time.sleep(1)
-            st.rerun()
-    
+        refresh_now = st.button("🔄 Refresh Now", type="primary")
     with refresh_col2:
-        if st.button("🗑️ Clear Cache"):
-            st.cache_data.clear()
-            st.sidebar.success("✅ Cache cleared!")
+        clear_cache = st.button("🗑️ Clear Cache")
+    # Both buttons act on the filtered competitions only, once the filters below are read
+    refresh_feedback = st.sidebar.empty()
     
     # Last refresh time
     time_since_refresh = datetime.now() - st.session_state.last_refresh
     st.sidebar.caption(f"🕐 Last refresh: {time_since_refresh.seconds}s ago")
     
+    display_source_health()
+    display_render_cache_stats()
+    display_debug_panel()
+    
     # Competition filters with enhanced UI
     st.sidebar.markdown("### 🎯 Competition Filters")
     
@@ -962,6 +2528,17 @@ def main():
     # Filter competitions
     filtered_competitions = get_filtered_competitions(competition_type, gender_filter, round_filter)
     
+    if refresh_now:
+        get_sheet_poller().request_refresh(list(filtered_competitions))
+        st.session_state.last_refresh = datetime.now()
+        refresh_feedback.success("✅ Data refreshed!")
+        time.sleep(1)
+        st.rerun()
+    
+    if clear_cache:
+        get_sheet_poller().invalidate(list(filtered_competitions))
+        refresh_feedback.success("✅ Cache cleared!")
+    
     # Main content area
     if len(filtered_competitions) == 0:
         st.markdown("""
@@ -981,9 +2558,12 @@ def main():
     completed_competitions = 0
     upcoming_competitions = 0
     
-    for comp_name, url in filtered_competitions.items():
-        df = load_sheet_data(url)
-        status, _ = get_competition_status(df, comp_name)
+    # Read the shared snapshots published by the background poller
+    with st.spinner("Loading competition data..."):
+        sheets = get_sheet_snapshots(filtered_competitions)
+    
+    for snapshot in sheets.values():
+        status = snapshot.competition.status
         if status == "live":
             live_competitions += 1
         elif status == "completed":
@@ -1007,46 +2587,30 @@ def main():
     
     # Handle single vs multiple competitions
     if len(filtered_competitions) > 1:
-        # Create tabs for multiple competitions
+        # Only the selected competition is computed and rendered; the others
+        # are rendered on demand when picked, so a rerun costs one competition
         tab_names = list(filtered_competitions.keys())
-        tabs = st.tabs(tab_names)
+        if st.session_state.get('active_competition') not in tab_names:
+            st.session_state.active_competition = tab_names[0]
         
-        for i, (comp_name, url) in enumerate(filtered_competitions.items()):
-            with tabs[i]:
-                with st.spinner(f"Loading {comp_name}..."):
-                    df = load_sheet_data(url)
-                    
-                current_time = datetime.now().strftime("%H:%M:%S")
-                st.caption(f"📡 Last updated: {current_time}")
-                
-                if "Boulder" in comp_name:
-                    display_boulder_results(df, comp_name)
-                elif "Lead" in comp_name:
-                    display_lead_results(df, comp_name)
-                else:
-                    if not df.empty:
-                        st.dataframe(df, use_container_width=True, hide_index=True)
-                    else:
-                        st.markdown('<div class="error-card">❌ No data available</div>', unsafe_allow_html=True)
+        selected = st.segmented_control(
+            "Competition",
+            tab_names,
+            selection_mode="single",
+            key="active_competition",
+            label_visibility="collapsed"
+        )
+        comp_name = selected or tab_names[0]
     else:
         # Single competition view
-        comp_name, url = list(filtered_competitions.items())[0]
-        
-        with st.spinner(f"Loading {comp_name}..."):
-            df = load_sheet_data(url)
-            
-        current_time = datetime.now().strftime("%H:%M:%S")
-        st.caption(f"📡 Last updated: {current_time}")
-        
-        if "Boulder" in comp_name:
-            display_boulder_results(df, comp_name)
-        elif "Lead" in comp_name:
-            display_lead_results(df, comp_name)
-        else:
-            if not df.empty:
-                st.dataframe(df, use_container_width=True, hide_index=True)
-            else:
-                st.markdown('<div class="error-card">❌ No data available</div>', unsafe_allow_html=True)
+        comp_name = list(filtered_competitions.keys())[0]
+    
+    replay = get_replay_snapshot(comp_name)
+    if replay is not None:
+        st.caption(f"⏪ Replaying the recorded snapshot from {replay.fetched_at.strftime('%d %b %H:%M:%S')}")
+        display_competition(replay)
+    else:
+        display_live_competition(comp_name, auto_refresh)
     
     # Footer with additional information
     st.markdown("---")
@@ -1057,13 +2621,6 @@ def main():
         st.markdown("**📊 Real-time Results Dashboard**")
     with col3:
         st.markdown("**🔄 Auto-updating data**")
-    
-    # Auto-refresh logic (improved)
-    if st.session_state.auto_refresh_enabled:
-        time_since_last = (datetime.now() - st.session_state.last_refresh).total_seconds()
-        if time_since_last >= CONFIG['AUTO_REFRESH_INTERVAL']:
-            st.session_state.last_refresh = datetime.now()
-            st.rerun()
 
 if __name__ == "__main__":
     try:
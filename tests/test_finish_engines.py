@@ -0,0 +1,119 @@
+"""Incremental finish engines against from-scratch and brute-force results.
+
+Run from the repository root:
+
+    $ python -m pytest -q tests
+"""
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from streamlit_app import FinishBounds, LeadThresholdCalculator, lead_score_value  # noqa: E402
+
+BOULDER_SCORES = [0, 9.8, 9.9, 10.0, 24.9, 25.0]
+LEAD_RESULTS = ["", "12", "28+", "35", "35+", "41", "TOP"]
+
+
+def random_round(rnd, athletes):
+    """(totals, remaining) for a boulder round with 0-4 boulders left per athlete"""
+    remaining = [rnd.randint(0, 4) for _ in range(athletes)]
+    totals = [round(sum(rnd.choice(BOULDER_SCORES) for _ in range(4 - left)), 1) for left in remaining]
+    return totals, remaining
+
+
+def brute_force_finishes(totals, remaining):
+    """(worst, best) finish of every athlete by counting rivals one by one"""
+    low = np.asarray(totals, dtype=float)
+    high = low + 25 * np.asarray(remaining)
+    n = len(low)
+    worst = [1 + sum(high[j] >= low[i] for j in range(n) if j != i) for i in range(n)]
+    best = [1 + sum(low[j] > high[i] for j in range(n) if j != i) for i in range(n)]
+    return worst, best
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_finish_bounds_match_brute_force(seed):
+    rnd = random.Random(seed)
+    totals, remaining = random_round(rnd, rnd.randint(1, 30))
+    bounds = FinishBounds(range(len(totals)), totals, remaining)
+    worst, best = brute_force_finishes(totals, remaining)
+    assert bounds.worst.tolist() == worst
+    assert bounds.best.tolist() == best
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_incremental_updates_match_recompute(seed):
+    rnd = random.Random(seed)
+    names = [f"Athlete {i}" for i in range(rnd.randint(1, 30))]
+    totals, remaining = random_round(rnd, len(names))
+    bounds = FinishBounds(names, totals, remaining)
+    for _ in range(10):
+        # A few athletes post a score; the sheet may also come back in another order
+        for i in rnd.sample(range(len(names)), rnd.randint(1, min(3, len(names)))):
+            if remaining[i]:
+                remaining[i] -= 1
+                totals[i] = round(totals[i] + rnd.choice(BOULDER_SCORES), 1)
+        order = list(range(len(names)))
+        rnd.shuffle(order)
+        bounds = bounds.updated([names[i] for i in order], [totals[i] for i in order], [remaining[i] for i in order])
+
+        fresh = FinishBounds(names, totals, remaining)
+        worst, best = bounds.for_names(names)
+        assert worst.tolist() == fresh.worst.tolist()
+        assert best.tolist() == fresh.best.tolist()
+
+
+def test_updated_with_a_different_field_recomputes():
+    bounds = FinishBounds(['A', 'B'], [25, 10], [0, 1])
+    updated = bounds.updated(['A', 'C'], [25, 30], [0, 0])
+    assert updated.for_names(['A', 'C'])[0].tolist() == [2, 1]
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_lead_thresholds_incremental_match_recompute(seed):
+    rnd = random.Random(seed)
+    climbers = [(f"Climber {i}", 0) for i in range(rnd.randint(1, 26))]
+    scores = {climber: lead_score_value(rnd.choice(LEAD_RESULTS)) for climber in climbers}
+    calculator = LeadThresholdCalculator().updated(scores)
+    for _ in range(10):
+        for climber in rnd.sample(climbers, rnd.randint(1, min(3, len(climbers)))):
+            scores[climber] = lead_score_value(rnd.choice(LEAD_RESULTS))
+        calculator = calculator.updated(scores)
+
+        posted = sorted(value for value in scores.values() if not np.isnan(value))
+        assert calculator.sorted == posted
+        for place in (1, 2, 3, 8):
+            expected = posted[-place] + 0.5 if place <= len(posted) else None
+            assert calculator.needed(place) == expected
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_last_boulder_targets_match_brute_force(seed):
+    rnd = random.Random(seed)
+    totals, remaining = random_round(rnd, rnd.randint(1, 20))
+    names = list(range(len(totals)))
+    places = (1, 2, 3, 8)
+    targets = FinishBounds(names, totals, remaining).last_boulder_targets(names, places)
+    ceilings = np.asarray(totals) + 25 * np.asarray(remaining)
+    for i in names:
+        for place in places:
+            needed = targets[place][i]
+            if remaining[i] != 1:
+                assert np.isnan(needed)
+                continue
+            # Lowest score on the 0.1 grid after which fewer than `place` rivals can still reach the athlete
+            sure = [
+                score / 10 for score in range(251)
+                if sum(ceilings[j] >= totals[i] + score / 10 - 1e-9 for j in names if j != i) < place
+            ]
+            if needed <= 0:
+                assert sure and sure[0] == 0
+            elif needed > 25:
+                assert not sure
+            else:
+                assert sure and sure[0] == pytest.approx(needed)
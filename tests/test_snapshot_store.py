@@ -0,0 +1,35 @@
+"""SnapshotStore round trips: what is loaded back hashes the same as what was appended.
+
+Run from the repository root:
+
+    $ python -m pytest -q tests
+"""
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from streamlit_app import SnapshotStore, frame_content_hash, parse_sheet_csv  # noqa: E402
+
+LEAD_CSV = (
+    "Name,Manual Score,Current Rank,Status,Worst Finish,Hold for 1st,Min to Qualify\n"
+    "Climber 0,41+,1,Qualified ✓✓,2,,\n"
+    "Climber 1,35,2,,,,\n"
+    "Climber 2,,3,,,,\n"
+    "Hold for 1st,,,,,42,22\n"
+)
+
+
+def test_append_then_load_round_trips(tmp_path):
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    first = parse_sheet_csv(LEAD_CSV.encode('utf-8'), "Lead")
+    second = first.copy()
+    second.loc[2, 'Manual Score'] = "28"  # Stored as a delta against the first frame
+
+    for df in (first, second):
+        assert store.append("Male Lead Semis", datetime.now(), df)
+    for (snapshot_id, _), df in zip(store.timeline("Male Lead Semis"), (first, second)):
+        _, content_hash, loaded = store.load(snapshot_id)
+        assert loaded.equals(df)
+        assert frame_content_hash(loaded) == content_hash == frame_content_hash(df)